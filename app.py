@@ -1,6 +1,7 @@
 import streamlit as st
 from datetime import datetime
-import yfinance as yf
+from stockbot.config import STOCKS, get_yfinance_symbol
+from stockbot.quotes import get_last_prices
 
 # ---------------------------
 # Page Configuration
@@ -63,27 +64,13 @@ st.markdown("""
 # ---------------------------
 # Stock Data
 # ---------------------------
+# Built from the shared stock config so the cards and the detail pages never drift apart
 stock_data = {
-    "Bharat Electronics": {
-        "page": "Bharat_Electronics",
-        "ticker": "BEL.NS"
-    },
-    "Tata Motors": {
-        "page": "Tata_Motors",
-        "ticker": "TATAMOTORS.NS"
-    },
-    "IRCTC": {
-        "page": "IRCTC",
-        "ticker": "IRCTC.NS"
-    },
-    "IndiGo Airlines": {
-        "page": "Indigo_Airlines",
-        "ticker": "INDIGO.NS"
-    },
-    "SBI": {
-        "page": "SBI",
-        "ticker": "SBIN.NS"
+    stock["card_name"]: {
+        "page": stock["page"],
+        "ticker": get_yfinance_symbol(stock_key, "NSE")
     }
+    for stock_key, stock in STOCKS.items()
 }
 
 # ---------------------------
@@ -98,19 +85,17 @@ st.markdown("---")
 # ---------------------------
 st.subheader("🧾 Tracked Equities")
 
-cols = st.columns(5)
+cols = st.columns(len(stock_data))
+
+# Fetch every card's price in one batched (and cached) yfinance call
+prices = get_last_prices(tuple(info["ticker"] for info in stock_data.values()))
 
 for col, (company, info) in zip(cols, stock_data.items()):
     ticker = info["ticker"]
     page = info["page"]
 
-    # Fetch price using yfinance
-    try:
-        stock = yf.Ticker(ticker)
-        price = stock.info['regularMarketPrice']
-        price_text = f"₹{price:.2f}" if price else "N/A"
-    except Exception:
-        price_text = "N/A"
+    price = prices.get(ticker)
+    price_text = f"₹{price:.2f}" if price else "N/A"
 
     with col:
         st.markdown(f"""
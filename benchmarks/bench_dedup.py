@@ -0,0 +1,40 @@
+# benchmarks/bench_dedup.py
+# Near-duplicate clustering time as the batch grows; each batch carries syndicated copies
+# (one or two words changed) of a tenth of its stories.
+# Run from the repo root: python benchmarks/bench_dedup.py
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stockbot.dedup import near_duplicate_clusters, simhash
+
+WORDS = ["profit", "loss", "bank", "growth", "order", "fleet", "rail", "defence", "credit", "deposit",
+         "margin", "quarter", "export", "fuel", "capacity", "guidance", "rating", "loan", "asset", "market"]
+
+def make_story(rng, n_words=40):
+    return [rng.choice(WORDS) + rng.choice("abcdefghij") for _ in range(n_words)]
+
+def make_batch(rng, n):
+    stories = [make_story(rng) for _ in range(n - n // 10)]
+    for story in rng.sample(stories, n // 10):
+        copy = list(story)
+        for _ in range(rng.randint(1, 2)):
+            copy[rng.randrange(len(copy))] = rng.choice(WORDS)
+        stories.append(copy)
+    return [simhash(" ".join(story)) for story in stories]
+
+def main():
+    rng = random.Random(42)
+    print(f"{'articles':>9} {'clusters':>9} {'total ms':>9} {'us/article':>11}")
+    for n in (2_000, 8_000, 32_000, 128_000):
+        fingerprints = make_batch(rng, n)
+        start = time.perf_counter()
+        clusters = near_duplicate_clusters(fingerprints)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>9,} {len(set(clusters.tolist())):>9,} {elapsed * 1e3:>9.1f} {elapsed / n * 1e6:>11.1f}")
+
+if __name__ == "__main__":
+    main()
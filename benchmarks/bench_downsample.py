@@ -0,0 +1,24 @@
+# benchmarks/bench_downsample.py
+# Chart payload before and after decimation for long 5-minute histories.
+# Run from the repo root: python benchmarks/bench_downsample.py
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stockbot.downsample import aggregate_ohlc, bar_budget, lttb
+from stockbot.mock_data import generate_mock_ohlcv
+
+def main():
+    for num_points in (10_000, 100_000, 1_000_000):
+        df = generate_mock_ohlcv(num_points, 5 * 60, (600, 700), (100000, 5000000), rng=42)
+        start = time.perf_counter()
+        candles = aggregate_ohlc(df, bar_budget("candles"))
+        line = lttb(df["Close"], bar_budget("line"))
+        elapsed = time.perf_counter() - start
+        assert candles["High"].max() == df["High"].max() and candles["Low"].min() == df["Low"].min()
+        print(f"{num_points:>10,} bars -> {len(candles)} candles + {len(line)} line points in {elapsed * 1e3:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
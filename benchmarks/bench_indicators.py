@@ -0,0 +1,30 @@
+# benchmarks/bench_indicators.py
+# Full indicator set over a panel of symbols x 1y of daily bars, computed as wide frames.
+# Run from the repo root: python benchmarks/bench_indicators.py
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stockbot.indicators import compute_indicator_panel
+from stockbot.mock_data import generate_mock_ohlcv
+
+def make_panel(n_symbols, n_bars=250):
+    frames = {f"SYM{i}": generate_mock_ohlcv(n_bars, 24 * 60 * 60, (100, 3000), (100000, 5000000), rng=i,
+                                             end="2026-01-01") for i in range(n_symbols)}
+    return {column: pd.DataFrame({symbol: df[column] for symbol, df in frames.items()})
+            for column in ("Open", "High", "Low", "Close", "Volume")}
+
+def main():
+    for n_symbols in (100, 500, 1000):
+        panel = make_panel(n_symbols)
+        start = time.perf_counter()
+        compute_indicator_panel(panel)
+        elapsed = time.perf_counter() - start
+        print(f"{n_symbols:>5} symbols x 250 bars: {elapsed * 1e3:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
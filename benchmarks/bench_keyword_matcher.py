@@ -0,0 +1,50 @@
+# benchmarks/bench_keyword_matcher.py
+# Per-article cost of the compiled Aho-Corasick lexicon vs. one `in` scan per keyword,
+# as the lexicon grows. Run from the repo root: python benchmarks/bench_keyword_matcher.py
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stockbot.keyword_matcher import KeywordAutomaton
+
+WORDS = ["profit", "loss", "bank", "growth", "order", "fleet", "rail", "defence", "credit", "deposit",
+         "margin", "quarter", "export", "fuel", "capacity", "guidance", "rating", "loan", "asset", "market"]
+
+def make_phrase(rng):
+    return " ".join(rng.choice(WORDS) + rng.choice("abcdefgh") for _ in range(rng.randint(1, 3)))
+
+def make_article(rng, n_words=120):
+    return " ".join(rng.choice(WORDS) + rng.choice("abcdefghij") for _ in range(n_words))
+
+def per_article_us(fn, articles, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for article in articles:
+            fn(article)
+        best = min(best, time.perf_counter() - start)
+    return best / len(articles) * 1e6
+
+def main():
+    rng = random.Random(42)
+    articles = [make_article(rng) for _ in range(200)]
+    print(f"{'phrases':>8} {'automaton us/article':>22} {'naive `in` us/article':>23}")
+    for size in (25, 250, 1000, 2500, 5000):
+        phrases = [make_phrase(rng) for _ in range(size)]
+        automaton = KeywordAutomaton((p, "positive") for p in phrases)
+
+        def naive(text):
+            text_lower = text.lower()
+            return {i for i, p in enumerate(phrases) if p in text_lower}
+
+        # Both strategies must agree before timing means anything
+        for article in articles[:20]:
+            assert automaton.search(article) == naive(article)
+
+        print(f"{size:>8} {per_article_us(automaton.search, articles):>22.1f} {per_article_us(naive, articles):>23.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# benchmarks/bench_mock_data.py
+# Throughput of the vectorized mock OHLCV generator used by load tests.
+# Run from the repo root: python benchmarks/bench_mock_data.py
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stockbot.mock_data import generate_mock_ohlcv
+
+def main():
+    for num_points in (10_000, 1_000_000, 5_000_000):
+        start = time.perf_counter()
+        df = generate_mock_ohlcv(num_points, 5 * 60, (600, 700), (100000, 5000000), rng=42)
+        elapsed = time.perf_counter() - start
+        assert len(df) == num_points
+        print(f"{num_points:>10,} bars in {elapsed * 1e3:8.1f} ms ({num_points / elapsed / 1e6:6.2f} M bars/s)")
+
+if __name__ == "__main__":
+    main()
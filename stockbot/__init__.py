@@ -0,0 +1 @@
+# Shared market-data, NLP and rendering helpers used by app.py and the pages/ dashboards.
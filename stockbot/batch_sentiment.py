@@ -0,0 +1,45 @@
+# stockbot/batch_sentiment.py
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+# --- Vectorized Batch Sentiment Scoring ---
+# Scores N articles at once: one automaton pass per article collects lexicon hits into a
+# sparse (COO) document-term matrix, which is reduced to per-article scores with a single
+# weighted bincount instead of per-article Python arithmetic.
+SENTIMENT_LABELS = np.array(["negative", "neutral", "positive"])
+LABEL_WEIGHTS = {"positive": 1.0, "negative": -1.0}
+
+BatchScores = namedtuple("BatchScores", ["scores", "labels", "entity_mask"])
+
+@lru_cache(maxsize=64)
+def _term_weights(lexicon):
+    labels = lexicon.automaton.labels
+    weights = np.array([LABEL_WEIGHTS.get(label, 0.0) for label in labels], dtype=np.float64)
+    is_entity = np.array([label == "entity" for label in labels], dtype=np.float64)
+    return weights, is_entity
+
+def hit_matrix(lexicon, texts):
+    # Row/column indices of the non-zero entries of the binary document-term matrix
+    search = lexicon.automaton.search
+    rows, cols = [], []
+    for doc_id, text in enumerate(texts):
+        hits = search(text)
+        rows.extend([doc_id] * len(hits))
+        cols.extend(hits)
+    return np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)
+
+def score_articles(lexicon, texts):
+    texts = list(texts)
+    n_docs = len(texts)
+    rows, cols = hit_matrix(lexicon, texts)
+    weights, is_entity = _term_weights(lexicon)
+
+    scores = np.bincount(rows, weights=weights[cols], minlength=n_docs)
+    entity_mask = np.bincount(rows, weights=is_entity[cols], minlength=n_docs) > 0
+    labels = SENTIMENT_LABELS[np.sign(scores).astype(np.int64) + 1]
+    return BatchScores(scores, labels, entity_mask)
+
+def article_text(article):
+    return f"{article.get('title', '')} {article.get('content', '')}"
@@ -0,0 +1,132 @@
+# stockbot/config.py
+import os
+
+# --- Local Storage ---
+# OHLC bars, cached NLP results and other on-disk state live under this directory
+DATA_DIR = os.getenv("STOCKBOT_DATA_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data"))
+
+# --- Shared Sentiment Lexicon ---
+# Generic keywords used for every stock; per-stock "lexicon_extensions" add sector terms.
+BASE_POSITIVE_KEYWORDS = ["profit", "soar", "jump", "rises", "invest", "contract", "boosts", "growth", "strong", "improves", "expands", "dividend", "bullish", "exceeding expectations", "robust", "healthy", "gains", "partnership", "collaboration", "launch"]
+BASE_NEGATIVE_KEYWORDS = ["loss", "headwinds", "rising fuel", "supply chain issues", "missed", "resigned", "downgrade", "decline", "fall", "struggle", "uncertainty", "volatility", "challenges"]
+BASE_NEUTRAL_KEYWORDS = ["board approves", "plans", "announces", "decision", "discussions", "talks", "quarterly results"]
+
+# --- Tracked Stocks ---
+# Adding a stock is one entry here plus a two-line file in pages/ that calls render_stock_page.
+STOCKS = {
+    "BEL": {
+        "card_name": "Bharat Electronics",
+        "display_name": "Bharat Electronics Limited",
+        "page": "Bharat_Electronics",
+        # BEL's BSE listing is 500055.BO, but yfinance also resolves BEL.BO
+        "exchange_symbols": {"NSE": "BEL.NS", "BSE": "BEL.BO"},
+        "name_variants": ["bel", "bharat electronics", "bharat electronics limited"],
+        "news_query": "Bharat Electronics Limited stock",
+        "lexicon_extensions": {},
+        "mock_price_range": (250, 270),
+        "mock_volume_range": (1000000, 10000000),
+    },
+    "TATAMOTORS": {
+        "card_name": "Tata Motors",
+        "display_name": "Tata Motors",
+        "page": "Tata_Motors",
+        "exchange_symbols": {"NSE": "TATAMOTORS.NS", "BSE": "TATAMOTORS.BO"},
+        "name_variants": ["tatamotors", "tata motors", "tata group", "jaguar land rover", "jlr", "commercial vehicles", "passenger vehicles"],
+        "news_query": "Tata Motors stock OR TATAMOTORS stock",
+        "lexicon_extensions": {
+            "positive": ["orders", "sales", "expansion", "success", "innovative"],
+            "negative": ["recalled", "slowdown", "competition"],
+            "neutral": ["updates"],
+        },
+        "mock_price_range": (900, 1000),
+        "mock_volume_range": (100000, 5000000),
+    },
+    "IRCTC": {
+        "card_name": "IRCTC",
+        "display_name": "IRCTC",
+        "page": "IRCTC",
+        "exchange_symbols": {"NSE": "IRCTC.NS", "BSE": "IRCTC.BO"},
+        "name_variants": ["irctc", "indian railways catering"],
+        "news_query": "IRCTC stock",
+        "lexicon_extensions": {},
+        "mock_price_range": (980, 1020),
+        "mock_volume_range": (100000, 5000000),
+    },
+    "INDIGO": {
+        "card_name": "IndiGo Airlines",
+        "display_name": "INDIGO",
+        "page": "Indigo_Airlines",
+        # IndiGo's BSE listing is 539448.BO; INDIGO.BO is kept for consistency with NSE
+        "exchange_symbols": {"NSE": "INDIGO.NS", "BSE": "INDIGO.BO"},
+        "name_variants": ["indigo", "indigo airlines", "interglobe aviation"],
+        "news_query": "INDIGO stock",
+        "lexicon_extensions": {},
+        "mock_price_range": (2500, 2800),
+        "mock_volume_range": (100000, 5000000),
+    },
+    "SBI": {
+        "card_name": "SBI",
+        "display_name": "SBI",
+        "page": "SBI",
+        "exchange_symbols": {"NSE": "SBIN.NS", "BSE": "SBIN.BO"},
+        "name_variants": ["sbi", "state bank of india"],
+        "news_query": "State Bank of India OR SBI stock",
+        "lexicon_extensions": { # Banking specific keywords
+            "positive": ["loan growth", "deposit growth", "asset quality improves", "NPA reduction", "credit expansion"],
+            "negative": ["NPA increase", "fraud", "scam", "regulatory fine"],
+            "neutral": ["RBI", "policy", "interest rates"],
+        },
+        "mock_price_range": (600, 700),
+        "mock_volume_range": (100000, 5000000),
+    },
+}
+
+def get_stock(stock_key: str):
+    return STOCKS[stock_key]
+
+def get_yfinance_symbol(stock_key: str, exchange: str = "NSE"):
+    stock = STOCKS.get(stock_key)
+    if stock and exchange.upper() in stock["exchange_symbols"]:
+        return stock["exchange_symbols"][exchange.upper()]
+    if exchange.upper() == "NSE": return f"{stock_key}.NS"
+    elif exchange.upper() == "BSE": return f"{stock_key}.BO"
+    return stock_key
+
+# --- Cache Settings ---
+# ttl: how long a value is fresh. max_staleness: how long a stale value may still be served
+# while a background refresh runs; past that, callers wait for the upstream call.
+# error_ttl: how long a failed upstream call is remembered, so callers get the fallback at
+# once instead of retrying on every rerun.
+CACHE_SETTINGS = {
+    "live_price": {"ttl": 5 * 60, "max_staleness": 60 * 60, "error_ttl": 5 * 60},
+    "news": {"ttl": 5 * 60, "max_staleness": 6 * 60 * 60, "error_ttl": 5 * 60},
+}
+
+# --- HTTP Client Settings (NewsAPI.org) ---
+HTTP_SETTINGS = {"pool_size": 10, "retries": 3, "backoff_factor": 0.5, "timeout": 10}
+
+# --- NLP Result Cache ---
+# In-memory LRU size, and whether results are also kept on disk across restarts
+NLP_CACHE_SETTINGS = {"max_entries": 10000, "disk": True}
+
+# --- Rolling Sentiment Index ---
+# half_life_hours: how fast an article's weight fades. label_threshold: index level beyond
+# which the rolling sentiment reads positive/negative. prior_weight: neutral articles averaged
+# into the index, so it fades to neutral once the real ones decay. max_series_points: how much
+# index history is kept for the chart.
+SENTIMENT_INDEX_SETTINGS = {"half_life_hours": 24, "label_threshold": 0.1, "prior_weight": 1.0,
+                            "max_seen_articles": 5000, "max_series_points": 5000}
+
+# --- Streaming Indicators ---
+# Timeframes whose indicators are updated bar by bar from the base series instead of being
+# recomputed over the whole window on every refresh.
+INDICATOR_STREAM_TIMEFRAMES = ("5m", "5m all")
+
+# --- Chart Settings ---
+# Streamlit does not report the rendered chart width to the script, so the decimation budget
+# assumes a typical wide-layout chart. Lines get one point per px_per_point pixels and
+# candles one bar per px_per_candle pixels; windows with fewer bars are drawn in full.
+# Traces with more than webgl_threshold points switch to WebGL; the high-resolution toggle
+# sends up to webgl_max_points bars per chart instead of the pixel budget.
+CHART_SETTINGS = {"width_px": 1200, "px_per_point": 1, "px_per_candle": 4, "min_points": 100,
+                  "webgl_threshold": 1000, "webgl_max_points": 200_000}
@@ -0,0 +1,119 @@
+# stockbot/dedup.py
+import hashlib
+import itertools
+import re
+
+import numpy as np
+
+# --- Near-duplicate Collapsing (SimHash + block-combination tables) ---
+# Syndicated copies of one wire story differ only in a few words, so their 64-bit SimHash
+# fingerprints differ in only a few bits. Fingerprints are split into BLOCKS blocks; two
+# fingerprints within MAX_DISTANCE bits leave at least KEY_BLOCKS blocks intact (pigeonhole),
+# so they share a key in one of the tables keyed on every KEY_BLOCKS-block combination.
+# Only fingerprints sharing a key are compared. Single 7-bit band keys put a fixed share of
+# all articles in every bucket, which made clustering quadratic; the ~17-bit keys here keep
+# buckets small. The tables (C(11, 3) = 165) are built and probed with numpy over the whole
+# batch, since 165 dict lookups per article would cost more than the comparisons they save.
+#
+# Features are single words. A NewsAPI title + description is only ~40 words, and a word
+# n-gram feature changes n features per edited word, so 3-gram fingerprints of one-word
+# edits already land 7-13 bits apart. With words, one or two edits (a swapped word, an
+# appended " - Moneycontrol") stay within ~7 bits, while different stories about the same
+# company sit ~18+ bits apart.
+SIMHASH_BITS = 64
+MAX_DISTANCE = 8
+BLOCKS = 11 # Blocks of 5-6 bits; at most 8 differing bits leave 3 blocks intact
+KEY_BLOCKS = BLOCKS - MAX_DISTANCE
+SHINGLE_SIZE = 1
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_BIT_POSITIONS = np.arange(SIMHASH_BITS, dtype=np.uint64)
+_BLOCK_EDGES = [block * SIMHASH_BITS // BLOCKS for block in range(BLOCKS + 1)]
+_KEY_COMBOS = list(itertools.combinations(range(BLOCKS), KEY_BLOCKS))
+_POPCOUNT8 = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+def _shingles(text: str):
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) <= SHINGLE_SIZE:
+        return [" ".join(tokens)]
+    if SHINGLE_SIZE == 1:
+        return tokens
+    return [" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)]
+
+def simhash(text: str):
+    shingles = _shingles(text)
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little") for s in shingles),
+        dtype=np.uint64, count=len(shingles))
+    # Each shingle votes +1/-1 on every bit; the fingerprint keeps the majority
+    bits = (hashes[:, None] >> _BIT_POSITIONS) & np.uint64(1)
+    majority = bits.sum(axis=0) * 2 > len(hashes)
+    return int((majority.astype(np.uint64) << _BIT_POSITIONS).sum())
+
+def _table_keys(fingerprints: np.ndarray, combo):
+    # Every fingerprint's key in one table: the bits of the table's blocks, concatenated
+    keys = np.zeros(len(fingerprints), dtype=np.uint64)
+    for block in combo:
+        start, end = _BLOCK_EDGES[block], _BLOCK_EDGES[block + 1]
+        bits = (fingerprints >> np.uint64(start)) & np.uint64((1 << (end - start)) - 1)
+        keys = (keys << np.uint64(end - start)) | bits
+    return keys
+
+def _shared_key_pairs(keys: np.ndarray):
+    # (earlier, later) positions of every two fingerprints with the same key in one table
+    n = len(keys)
+    # Keys are at most 18 bits; packing the position below them sorts by key, then position,
+    # and a plain sort of the packed values is several times faster than a stable argsort
+    packed = np.sort((keys << np.uint64(32)) | np.arange(n, dtype=np.uint64))
+    sorted_keys = packed >> np.uint64(32)
+    order = (packed & np.uint64(0xFFFFFFFF)).astype(np.int64)
+    run_start = np.ones(n, dtype=bool)
+    run_start[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    run_start = np.maximum.accumulate(np.where(run_start, np.arange(n), 0))
+    # Each position pairs with the run members sorted before it
+    counts = np.arange(n) - run_start
+    later = np.repeat(np.arange(n), counts)
+    earlier = run_start[later] + np.arange(len(later)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return order[earlier], order[later]
+
+def _hamming(a: np.ndarray, b: np.ndarray):
+    return _POPCOUNT8[(a ^ b).view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+def near_duplicate_clusters(fingerprints):
+    # Cluster label per fingerprint, in order: each fingerprint joins the earliest cluster
+    # representative within MAX_DISTANCE bits, or becomes a representative itself.
+    fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+    # Exact copies share one fingerprint; they are clustered once, in order of first appearance
+    values, first, inverse = np.unique(fingerprints, return_index=True, return_inverse=True)
+    appearance = np.argsort(first)
+    rank = np.empty_like(appearance)
+    rank[appearance] = np.arange(len(appearance))
+    unique = values[appearance]
+
+    near = []
+    for combo in _KEY_COMBOS:
+        earlier, later = _shared_key_pairs(_table_keys(unique, combo))
+        close = _hamming(unique[earlier], unique[later]) <= MAX_DISTANCE
+        near.append(earlier[close] * len(unique) + later[close])
+    # A pair sharing several tables is kept once, sorted by later position, then earlier
+    pairs = np.unique(np.concatenate(near)) if near else np.empty(0, dtype=np.int64)
+    earlier, later = np.divmod(pairs, len(unique))
+    order = np.lexsort((earlier, later))
+
+    clusters = np.arange(len(unique))
+    for i, j in zip(earlier[order].tolist(), later[order].tolist()):
+        # Representatives are final by the time a later fingerprint is reached
+        if clusters[j] == j and clusters[i] == i:
+            clusters[j] = i
+    return clusters[rank[inverse.ravel()]]
+
+def collapse_near_duplicates(articles):
+    # Keeps the first article of each cluster (the newest, for newest-first lists) and records
+    # how many copies it stands for in "cluster_size".
+    fingerprints = [simhash(f"{article.get('title', '')} {article.get('content', '')}") for article in articles]
+    representatives = {}
+    for article, cluster_id in zip(articles, near_duplicate_clusters(fingerprints).tolist()):
+        if cluster_id not in representatives:
+            representatives[cluster_id] = dict(article, cluster_size=0)
+        representatives[cluster_id]["cluster_size"] += 1
+    return list(representatives.values())
@@ -0,0 +1,74 @@
+# stockbot/downsample.py
+import numpy as np
+import pandas as pd
+
+from stockbot.config import CHART_SETTINGS
+
+# --- Chart Decimation ---
+# A chart can only show about one line point per pixel and one candle per few pixels, so
+# sending more bars than that only grows the websocket payload and the browser's render
+# time. Lines keep their visual shape with Largest-Triangle-Three-Buckets; candles are merged
+# into wider OHLC buckets so every high and low still shows up.
+
+def bar_budget(kind: str, width_px: int = CHART_SETTINGS["width_px"], high_res: bool = False):
+    # Points to send for a chart `width_px` wide: "line" or "candles". High-resolution mode
+    # draws with WebGL, which stays interactive with far more points than pixels.
+    if high_res:
+        return CHART_SETTINGS["webgl_max_points"]
+    per_point = CHART_SETTINGS["px_per_point"] if kind == "line" else CHART_SETTINGS["px_per_candle"]
+    return max(int(width_px / per_point), CHART_SETTINGS["min_points"])
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int):
+    # Positions of the points LTTB keeps; always includes the first and last point
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    # n - 2 interior points split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # The third triangle vertex is the average of the next bucket (or the last point)
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_start = end if end < next_end else n - 1
+        avg_x, avg_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+def lttb(series: pd.Series, n_out: int):
+    if len(series) <= n_out:
+        return series
+    clean = series.dropna()
+    if len(clean) <= n_out:
+        return clean
+    x = clean.index.asi8 if isinstance(clean.index, pd.DatetimeIndex) else np.arange(len(clean))
+    return clean.iloc[lttb_indices(x, clean.to_numpy(), n_out)]
+
+def aggregate_ohlc(df: pd.DataFrame, n_out: int):
+    # Merges consecutive bars into n_out buckets: first open, max high, min low, last close,
+    # summed volume, labelled with the bucket's first timestamp.
+    n = len(df)
+    if n <= n_out:
+        return df
+    starts = np.unique(np.arange(n_out) * n // n_out)
+    ends = np.append(starts[1:], n) - 1
+    out = {
+        "Open": df["Open"].to_numpy()[starts],
+        "High": np.maximum.reduceat(df["High"].to_numpy(), starts),
+        "Low": np.minimum.reduceat(df["Low"].to_numpy(), starts),
+        "Close": df["Close"].to_numpy()[ends],
+    }
+    if "Volume" in df:
+        out["Volume"] = np.add.reduceat(df["Volume"].to_numpy(), starts)
+    return pd.DataFrame(out, index=df.index[starts])
+
+def zoom_window(df: pd.DataFrame, start, end):
+    # Bars between two naive datetimes from the zoom slider, whatever the index timezone
+    index = df.index.tz_localize(None) if df.index.tz is not None else df.index
+    return df[(index >= pd.Timestamp(start)) & (index <= pd.Timestamp(end))]
@@ -0,0 +1,94 @@
+# stockbot/figure_cache.py
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import plotly
+import plotly.offline
+import streamlit.components.v1 as components
+
+from stockbot.config import DATA_DIR
+
+# --- Prebuilt Figure Cache ---
+# Building a go.Figure and running update_layout validates every property, which costs far
+# more than the data it draws. Figures are serialized to JSON once per (symbol, timeframe,
+# chart, data version) and later reruns hand that JSON straight to Plotly.js in the browser,
+# so no figure object is built or validated again for data that has not changed.
+class FigureCache:
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build, *args):
+        # Returns the cached figure JSON for `key`, calling build(*args) -> go.Figure on a miss
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        figure_json = build(*args).to_json()
+        with self._lock:
+            self._entries[key] = figure_json
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return figure_json
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+def data_version(*frames, extra=()):
+    # Content hash of the (already decimated) frames plus any render options
+    digest = hashlib.blake2b(digest_size=16)
+    for frame in frames:
+        if frame.shape[1] == 0:
+            continue # No overlays selected
+        digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    digest.update(repr(extra).encode("utf-8"))
+    return digest.hexdigest()
+
+# --- Plotly.js Chart Component ---
+# Cached JSON is drawn by a small Streamlit component instead of st.plotly_chart, which would
+# rebuild and validate a go.Figure from it. The component serves the plotly.js bundle that
+# ships with the installed plotly package, so the browser draws exactly the schema to_json()
+# targets and needs no CDN. The bundle is served by the Streamlit server like any static
+# component file, so browsers cache it. Charts drawn this way do not pick up the Streamlit
+# theme.
+PLOTLY_COMPONENT_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plotly_component")
+PLOTLY_COMPONENT_DIR = os.path.join(DATA_DIR, "plotly_component")
+
+def _install_plotly_component():
+    # Copies the component page and writes the installed plotly.js bundle next to it
+    os.makedirs(PLOTLY_COMPONENT_DIR, exist_ok=True)
+    shutil.copyfile(os.path.join(PLOTLY_COMPONENT_SOURCE, "index.html"), os.path.join(PLOTLY_COMPONENT_DIR, "index.html"))
+    version_path = os.path.join(PLOTLY_COMPONENT_DIR, "plotly_version.txt")
+    bundle_path = os.path.join(PLOTLY_COMPONENT_DIR, "plotly.min.js")
+    installed = None
+    if os.path.exists(version_path) and os.path.exists(bundle_path):
+        with open(version_path) as f:
+            installed = f.read().strip()
+    if installed != plotly.__version__:
+        tmp_path = f"{bundle_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(plotly.offline.get_plotlyjs())
+        os.replace(tmp_path, bundle_path)
+        with open(version_path, "w") as f:
+            f.write(plotly.__version__)
+    return PLOTLY_COMPONENT_DIR
+
+_plotly_json_chart = components.declare_component("stockbot_plotly_json_chart", path=_install_plotly_component())
+
+def render_figure_json(figure_json: str, height: int, key: str):
+    # Draws serialized figure JSON client-side; only the JSON string crosses the websocket
+    _plotly_json_chart(figure_json=figure_json, height=height, key=f"fig-{key}", default=None)
+
+# Shared by every page and session in the process
+FIGURE_CACHE = FigureCache()
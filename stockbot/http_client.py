@@ -0,0 +1,47 @@
+# stockbot/http_client.py
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# --- Pooled Keep-alive HTTP Client ---
+# One requests.Session per upstream host, shared by every page and session in the process,
+# so repeat calls reuse an open TCP+TLS connection instead of handshaking each time.
+class PooledHTTPClient:
+    def __init__(self, pool_size: int = 10, retries: int = 3, backoff_factor: float = 0.5, timeout: float = 10):
+        self.timeout = timeout
+        self.session = requests.Session()
+        # 429 is deliberately not retried: on a quota-limited plan a retry only burns quota
+        retry = Retry(total=retries, backoff_factor=backoff_factor,
+                      status_forcelist=(500, 502, 503, 504), allowed_methods=frozenset(["GET"]),
+                      raise_on_status=False)
+        self._adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate", "User-Agent": "StockNewsBotApp"})
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+
+    def get(self, url: str, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        with self._lock:
+            self.requests_sent += 1
+        return self.session.get(url, **kwargs)
+
+    def connection_stats(self):
+        # urllib3 counts new sockets and requests per host pool; the difference is reuse
+        connections_opened = 0
+        pool_requests = 0
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            connections_opened += pool.num_connections
+            pool_requests += pool.num_requests
+        return {
+            "requests_sent": self.requests_sent,
+            "connections_opened": connections_opened,
+            "connections_reused": max(pool_requests - connections_opened, 0),
+        }
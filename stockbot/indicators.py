@@ -0,0 +1,87 @@
+# stockbot/indicators.py
+import numpy as np
+import pandas as pd
+
+# --- Vectorized Technical Indicators ---
+# Every kernel is a pandas rolling/ewm/cumsum operation with no Python loop over bars. Inputs
+# may be a Series (one symbol) or a wide DataFrame (one column per symbol), so a whole panel
+# of symbols is computed in one call. EMA-style smoothing uses adjust=False, i.e. the plain
+# recursive form, so the streaming versions in streaming_indicators.py match bar for bar.
+DEFAULT_INDICATOR_PARAMS = {
+    "sma_window": 20,
+    "ema_span": 50,
+    "rsi_period": 14,
+    "macd_fast": 12,
+    "macd_slow": 26,
+    "macd_signal": 9,
+    "bb_window": 20,
+    "bb_num_std": 2.0,
+    "atr_period": 14,
+}
+
+def sma(close, window: int = 20):
+    return close.rolling(window, min_periods=window).mean()
+
+def ema(close, span: int = 20):
+    return close.ewm(span=span, adjust=False).mean()
+
+def rsi(close, period: int = 14):
+    # Wilder's smoothing (alpha = 1/period) of gains and losses
+    delta = close.diff()
+    avg_gain = delta.clip(lower=0).ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+    avg_loss = (-delta.clip(upper=0)).ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+    rs = avg_gain / avg_loss
+    return 100 - 100 / (1 + rs)
+
+def macd(close, fast: int = 12, slow: int = 26, signal: int = 9):
+    macd_line = ema(close, fast) - ema(close, slow)
+    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    return macd_line, signal_line, macd_line - signal_line
+
+def bollinger(close, window: int = 20, num_std: float = 2.0):
+    mid = sma(close, window)
+    std = close.rolling(window, min_periods=window).std(ddof=0)
+    return mid, mid + num_std * std, mid - num_std * std
+
+def true_range(high, low, close):
+    prev_close = close.shift(1)
+    # fmax ignores the NaN previous close on the first bar, leaving high - low
+    return np.fmax(high - low, np.fmax((high - prev_close).abs(), (low - prev_close).abs()))
+
+def atr(high, low, close, period: int = 14):
+    return true_range(high, low, close).ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+
+def vwap(high, low, close, volume):
+    # Intraday bars reset at each session; daily and coarser bars anchor at the first bar
+    typical_volume = (high + low + close) / 3 * volume
+    sessions = close.index.normalize()
+    if sessions.has_duplicates:
+        return typical_volume.groupby(sessions).cumsum() / volume.groupby(sessions).cumsum()
+    return typical_volume.cumsum() / volume.cumsum()
+
+def compute_indicators(df: pd.DataFrame, params: dict = None):
+    # Full indicator set for one OHLCV frame, aligned to its index
+    p = {**DEFAULT_INDICATOR_PARAMS, **(params or {})}
+    out = compute_indicator_panel({column: df[column] for column in ("Open", "High", "Low", "Close", "Volume")}, p)
+    return pd.DataFrame(out, index=df.index)
+
+def compute_indicator_panel(panel: dict, params: dict = None):
+    # panel: {"High": ..., "Low": ..., "Close": ..., "Volume": ...} as Series or wide frames.
+    # Returns {indicator name: Series/frame} in the same shape.
+    p = {**DEFAULT_INDICATOR_PARAMS, **(params or {})}
+    high, low, close, volume = panel["High"], panel["Low"], panel["Close"], panel["Volume"]
+    macd_line, signal_line, histogram = macd(close, p["macd_fast"], p["macd_slow"], p["macd_signal"])
+    bb_mid, bb_upper, bb_lower = bollinger(close, p["bb_window"], p["bb_num_std"])
+    return {
+        f"SMA_{p['sma_window']}": sma(close, p["sma_window"]),
+        f"EMA_{p['ema_span']}": ema(close, p["ema_span"]),
+        f"RSI_{p['rsi_period']}": rsi(close, p["rsi_period"]),
+        "MACD": macd_line,
+        "MACD_signal": signal_line,
+        "MACD_hist": histogram,
+        "BB_mid": bb_mid,
+        "BB_upper": bb_upper,
+        "BB_lower": bb_lower,
+        f"ATR_{p['atr_period']}": atr(high, low, close, p["atr_period"]),
+        "VWAP": vwap(high, low, close, volume),
+    }
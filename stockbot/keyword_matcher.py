@@ -0,0 +1,130 @@
+# stockbot/keyword_matcher.py
+import hashlib
+from collections import deque
+from functools import lru_cache
+
+# --- Multi-pattern Keyword Matching (Aho-Corasick) ---
+# The automaton is compiled once per lexicon and finds every phrase in a single pass over
+# the text, so per-article cost depends on the article length, not on how many phrases
+# the lexicon holds. Matching is case-insensitive substring matching, like the `in` checks
+# it replaces, except for phrases that must match as whole words.
+class KeywordAutomaton:
+    def __init__(self, patterns, whole_words=False):
+        # patterns: iterable of (phrase, label) pairs. A whole-word hit only counts when it is
+        # not glued to letters/digits on either side ("bel" does not match "below").
+        # whole_words is True (every pattern) or a collection of labels that need it.
+        self.whole_words = whole_words
+        self.phrases = []
+        self.labels = []
+        self._whole = [] # Per pattern: must it match as whole words?
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+        for phrase, label in patterns:
+            phrase = phrase.lower()
+            if not phrase:
+                continue
+            pattern_id = len(self.phrases)
+            self.phrases.append(phrase)
+            self.labels.append(label)
+            self._whole.append(whole_words is True or (bool(whole_words) and label in whole_words))
+
+            state = 0
+            for ch in phrase:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                    self._goto[state][ch] = next_state
+                state = next_state
+            self._out[state] += (pattern_id,)
+
+        # Breadth-first pass to set failure links; each state also inherits the matches
+        # of its failure state so the search loop never has to walk the chain for output.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+                self._fail[next_state] = fail
+                self._out[next_state] += self._out[fail]
+
+    def search(self, text: str):
+        # Returns the ids of every pattern that occurs at least once in `text`
+        text_lower = text.lower()
+        if any(self._whole):
+            return self._search_whole_words(text_lower)
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = set()
+        state = 0
+        for ch in text_lower:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                hits.update(out[state])
+        return hits
+
+    def _search_whole_words(self, text_lower: str):
+        # Same single pass; word boundaries are only checked for patterns flagged whole-word
+        goto, fail, out, phrases, whole = self._goto, self._fail, self._out, self.phrases, self._whole
+        hits = set()
+        state = 0
+        last = len(text_lower) - 1
+        for end, ch in enumerate(text_lower):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            ends_word = end == last or not text_lower[end + 1].isalnum()
+            for pattern_id in out[state]:
+                if not whole[pattern_id]:
+                    hits.add(pattern_id)
+                    continue
+                start = end - len(phrases[pattern_id]) + 1
+                if ends_word and (start == 0 or not text_lower[start - 1].isalnum()):
+                    hits.add(pattern_id)
+        return hits
+
+    def match_labels(self, text: str):
+        matches = {}
+        for pattern_id in self.search(text):
+            matches.setdefault(self.labels[pattern_id], set()).add(self.phrases[pattern_id])
+        return matches
+
+# --- Sentiment / Entity Lexicon ---
+ENTITY_WHOLE_WORD_LABELS = frozenset({"entity"})
+
+class Lexicon:
+    def __init__(self, positive=(), negative=(), neutral=(), entities=()):
+        self.terms = {
+            "positive": tuple(positive),
+            "negative": tuple(negative),
+            "neutral": tuple(neutral),
+            "entity": tuple(entities),
+        }
+        # Entity names must match as whole words ("bel" is not in "label below"); sentiment
+        # keywords keep substring matching so "profit" still counts in "profitable".
+        self.automaton = KeywordAutomaton(
+            ((phrase, label) for label, phrases in self.terms.items() for phrase in phrases),
+            whole_words=ENTITY_WHOLE_WORD_LABELS,
+        )
+        # Changes whenever any phrase (or how entities match) changes; used to key cached NLP results
+        fingerprint = "\n".join(f"{label}:{','.join(sorted(p.lower() for p in phrases))}"
+                                for label, phrases in sorted(self.terms.items()))
+        fingerprint += f"\nwhole_words:{','.join(sorted(ENTITY_WHOLE_WORD_LABELS))}"
+        self.version = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=8).hexdigest()
+
+@lru_cache(maxsize=64)
+def compile_lexicon(positive: tuple, negative: tuple, neutral: tuple, entities: tuple = ()):
+    # Streamlit re-executes page scripts on every rerun; the compiled automaton lives here so
+    # it is built once per process, not once per rerun.
+    return Lexicon(positive, negative, neutral, entities)
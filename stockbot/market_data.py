@@ -0,0 +1,90 @@
+# stockbot/market_data.py
+import hashlib
+import time
+
+import pandas as pd
+import streamlit as st
+import yfinance as yf
+
+from stockbot.config import CACHE_SETTINGS, INDICATOR_STREAM_TIMEFRAMES, get_stock, get_yfinance_symbol
+from stockbot.indicators import compute_indicators
+from stockbot.mock_data import MOCK_TIMEFRAMES, generate_mock_ohlcv, mock_last_price
+from stockbot.ohlc_store import fetch_bars
+from stockbot.resample import BASE_PERIODS, base_interval_for, timeframe_view
+from stockbot.singleflight import UPSTREAM_FETCHES
+from stockbot.streaming_indicators import INDICATOR_STREAMS
+from stockbot.swr_cache import CachedValue, StaleWhileRevalidateCache
+
+# --- Mock Data Generation (Fallback if yfinance/NewsAPI fail) ---
+def generate_mock_stock_data_local(stock_key, timeframe, num_points_override=None, rng=None):
+    stock = get_stock(stock_key)
+    interval_seconds, num_points = MOCK_TIMEFRAMES.get(timeframe, MOCK_TIMEFRAMES['1y'])
+    if num_points_override: num_points = num_points_override
+    return generate_mock_ohlcv(num_points, interval_seconds, stock["mock_price_range"],
+                               stock["mock_volume_range"], rng=rng)
+
+# --- Financial Data Integration (yfinance) ---
+# Live prices are served stale-while-revalidate: an expired price is returned immediately
+# and refreshed in the background, so a page render never waits on `.info` once warm.
+LIVE_PRICE_CACHE = StaleWhileRevalidateCache("live_price", **CACHE_SETTINGS["live_price"])
+
+def _fetch_regular_market_price(yf_symbol: str):
+    print(f"Attempting yfinance live price for: {yf_symbol}")
+    live_price = yf.Ticker(yf_symbol).info.get('regularMarketPrice')
+    if live_price is None:
+        raise ValueError(f"No live price found for {yf_symbol} in ticker info")
+    print(f"yfinance: Successfully fetched live price for {yf_symbol}: {live_price}")
+    return float(live_price)
+
+def get_live_price_entry(stock_key: str, exchange: str = "NSE"):
+    # Returns a CachedValue so the page can show how old the price is
+    yf_symbol = get_yfinance_symbol(stock_key, exchange)
+    try:
+        return LIVE_PRICE_CACHE.get((yf_symbol,), _fetch_regular_market_price, yf_symbol)
+    except Exception as e:
+        print(f"Fallback: yfinance live price failed for {yf_symbol}: {e}. Generating mock.")
+        # Seeded from the symbol, so the mock quote does not jump around on every rerun
+        seed = int.from_bytes(hashlib.blake2b(yf_symbol.encode("utf-8"), digest_size=8).digest(), "little")
+        mock_price = mock_last_price(get_stock(stock_key)["mock_price_range"], rng=seed)
+        return CachedValue(mock_price, time.time(), 0.0, False)
+
+@st.cache_data(ttl=15 * 60) # Cache for 15 minutes
+def get_base_ohlc_yf(stock_key: str, base_interval: str, exchange: str = "NSE"):
+    # One base series per (symbol, interval); every timeframe is derived from it locally
+    yf_symbol = get_yfinance_symbol(stock_key, exchange)
+    print(f"Attempting yfinance base series for: {yf_symbol} ({base_interval})")
+    try:
+        # Reads the on-disk store first and only pulls bars newer than the last stored one
+        return UPSTREAM_FETCHES.do(("ohlc", yf_symbol, base_interval), fetch_bars,
+                                   yf_symbol, base_interval, BASE_PERIODS[base_interval])
+    except Exception as e:
+        print(f"Fallback: yfinance base series failed for {yf_symbol} ({base_interval}): {e}.")
+        return pd.DataFrame()
+
+def get_historical_ohlc_yf(stock_key: str, timeframe: str, exchange: str = "NSE"):
+    base_df = get_base_ohlc_yf(stock_key, base_interval_for(timeframe), exchange)
+    df = timeframe_view(base_df, timeframe)
+
+    if not df.empty:
+        print(f"Resampled {len(df)} historical points for {stock_key} ({timeframe}) from the base series.")
+        return df
+    else:
+        print(f"yfinance: No historical data found for {stock_key} ({timeframe}). Generating mock.")
+        return generate_mock_stock_data_local(stock_key, timeframe=timeframe)
+
+# --- Technical Indicators ---
+@st.cache_data(ttl=15 * 60) # Same lifetime as the base series they are computed from
+def get_indicators(stock_key: str, timeframe: str, params: tuple = ()):
+    # Cached per (symbol, timeframe, params); `params` is a tuple of (name, value) overrides
+    df = get_historical_ohlc_yf(stock_key, timeframe, "NSE")
+    if timeframe in INDICATOR_STREAM_TIMEFRAMES:
+        base_interval = base_interval_for(timeframe)
+        base_df = get_base_ohlc_yf(stock_key, base_interval, "NSE")
+        if not base_df.empty and df.index.isin(base_df.index).all():
+            # Only bars added since the last refresh are folded in; the view is a slice of the
+            # stream, which is kept per base series so every view of it shares one stream
+            frame = INDICATOR_STREAMS.extend(get_yfinance_symbol(stock_key, "NSE"), base_interval, base_df, dict(params))
+            # The stream keeps BASE_PERIODS of history; longer views use the vectorized path
+            if not frame.empty and frame.index[0] <= df.index[0]:
+                return frame.reindex(df.index)
+    return compute_indicators(df, dict(params))
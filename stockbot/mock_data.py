@@ -0,0 +1,49 @@
+# stockbot/mock_data.py
+import numpy as np
+import pandas as pd
+
+# --- Vectorized Mock OHLCV Generation (Fallback if yfinance fails, and for load tests) ---
+# timeframe -> (bar interval in seconds, number of bars)
+MOCK_TIMEFRAMES = {
+    '5m': (5 * 60, 60),
+    '5m all': (5 * 60, 22 * 75), # About a month of NSE sessions
+    '1d': (60 * 60, 8),
+    '1w': (24 * 60 * 60, 5),
+    '1m': (24 * 60 * 60, 20),
+    '1y': (24 * 60 * 60, 250),
+}
+
+def generate_mock_ohlcv(num_points, interval_seconds, price_range, volume_range, rng=None, end=None):
+    # Same random walk as the original per-bar loop (±1% open gap, ±1% open->close move,
+    # up to 1% wicks), but every bar is built at once: one draw for all random numbers and
+    # a cumulative product for the close path. `rng` may be a seed or an np.random.Generator.
+    rng = np.random.default_rng(rng)
+    draws = rng.random(5 * num_points + 1)
+    start_price = price_range[0] + (price_range[1] - price_range[0]) * draws[0]
+    open_u, close_u, high_u, low_u, volume_u = draws[1:].reshape(5, num_points)
+
+    open_factor = 1 + (open_u - 0.5) * 0.02
+    close_factor = 1 + (close_u - 0.5) * 0.02
+    close = start_price * np.cumprod(open_factor * close_factor)
+    prev_close = np.empty_like(close)
+    prev_close[:1] = start_price
+    prev_close[1:] = close[:-1]
+    open_ = prev_close * open_factor
+    high = np.maximum(open_, close) * (1 + high_u * 0.01)
+    low = np.minimum(open_, close) * (1 - low_u * 0.01)
+    volume = (volume_range[0] + volume_u * (volume_range[1] - volume_range[0])).astype(np.int64)
+
+    end = pd.Timestamp.now() if end is None else pd.Timestamp(end)
+    index = pd.date_range(end=end, periods=num_points, freq=pd.Timedelta(seconds=interval_seconds), name='Date')
+    return pd.DataFrame({
+        'Open': np.round(open_, 2), 'High': np.round(high, 2),
+        'Low': np.round(low, 2), 'Close': np.round(close, 2),
+        'Volume': volume,
+    }, index=index)
+
+def mock_last_price(price_range, rng=None):
+    # A single fake quote without building a one-row DataFrame
+    rng = np.random.default_rng(rng)
+    start_u, open_u, close_u = rng.random(3)
+    start_price = price_range[0] + (price_range[1] - price_range[0]) * start_u
+    return round(float(start_price * (1 + (open_u - 0.5) * 0.02) * (1 + (close_u - 0.5) * 0.02)), 2)
@@ -0,0 +1,192 @@
+# stockbot/news.py
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import requests
+import streamlit as st
+
+from stockbot.config import CACHE_SETTINGS, DATA_DIR, HTTP_SETTINGS, STOCKS, get_stock
+from stockbot.http_client import PooledHTTPClient
+from stockbot.news_archive import NewsArchive
+from stockbot.nlp import route_articles
+from stockbot.search_index import InvertedIndex
+from stockbot.swr_cache import CachedValue, StaleWhileRevalidateCache
+
+NEWS_API_URL = "https://newsapi.org/v2/everything"
+NEWSAPI_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Articles seen by any page survive restarts; refreshes fetch only what is newer
+NEWS_ARCHIVE = NewsArchive(os.path.join(DATA_DIR, "news_archive.sqlite"))
+
+# One pooled keep-alive client for every page and session in this process
+NEWS_CLIENT = PooledHTTPClient(**HTTP_SETTINGS)
+
+# --- API Key Configuration (for Streamlit Cloud: use st.secrets) ---
+# Locally, the NEWS_API_KEY environment variable is used when no secrets file exists.
+def get_news_api_key():
+    try:
+        key = st.secrets.get("NEWS_API_KEY")
+    except Exception:
+        key = None
+    return key or os.getenv("NEWS_API_KEY")
+
+def _mock_news(query, reason, content):
+    return [{
+        "source": "Mock News", "title": f"Mock News for {query} - {reason}",
+        "content": content,
+        "url": "#", "publishedAt": datetime.now().isoformat(), "event": "Mock Event"
+    }]
+
+def _fresh(value):
+    return CachedValue(value, time.time(), 0.0, False)
+
+# --- News API Integration (NewsAPI.org) ---
+class NewsAPIError(Exception):
+    # An error answer from NewsAPI; `code` is its machine-readable error code (e.g.
+    # "maximumResultsReached", "rateLimited") and `status_code` the HTTP status.
+    def __init__(self, message, code=None, status_code=None):
+        super().__init__(message)
+        self.code = code
+        self.status_code = status_code
+
+def _request_everything(params):
+    response = NEWS_CLIENT.get(NEWS_API_URL, params=params)
+    print(f"NewsAPI.org connection stats: {NEWS_CLIENT.connection_stats()}")
+    try:
+        data = response.json()
+    except ValueError:
+        response.raise_for_status() # Non-JSON error pages surface as HTTPError
+        raise NewsAPIError("Response was not JSON", status_code=response.status_code)
+    # NewsAPI reports errors as JSON bodies with status "error", usually with a 4xx status
+    if response.status_code >= 400 or data.get("status") != "ok":
+        raise NewsAPIError(data.get("message", f"HTTP {response.status_code}"), data.get("code"), response.status_code)
+    return data
+
+def _parse_articles(data):
+    articles = []
+    for article in data["articles"]:
+        articles.append({
+            "source": (article.get("source") or {}).get("name", "Unknown"),
+            "title": article.get("title") or "No Title",
+            "content": article.get("description") or article.get("content") or "No content available",
+            "url": article.get("url", "#"),
+            "publishedAt": article.get("publishedAt", "N/A"),
+            "event": "General News"
+        })
+    return articles
+
+# Served stale-while-revalidate; concurrent ingestions are coalesced
+NEWS_CACHE = StaleWhileRevalidateCache("news", **CACHE_SETTINGS["news"])
+
+def _news_fallback(query, error):
+    # Mock articles that say why the real ones are missing
+    if isinstance(error, NewsAPIError):
+        error_msg = str(error)
+        print(f"NewsAPI.org Error for '{query}': {error_msg}")
+        if error.code in ("maximumResultsReached", "rateLimited"):
+            print("Fallback: NewsAPI.org free plan limit. Returning mock news.")
+            return _mock_news(query, "Rate Limit", "This is a mock news article due to NewsAPI.org rate limits.")
+        # Fallback for other NewsAPI errors
+        return _mock_news(query, f"API Error: {error_msg}", "News fetching failed. Using mock data.")
+    if isinstance(error, requests.exceptions.Timeout):
+        print(f"Fallback: NewsAPI.org Timeout for '{query}'. Returning mock news.")
+        return _mock_news(query, "Timeout", "This is a mock news article due to NewsAPI.org timeout.")
+    print(f"Fallback: NewsAPI.org Request failed for '{query}': {error}. Returning mock news.")
+    return _mock_news(query, "Request Failed", "This is a mock news article due to NewsAPI.org request failure.")
+
+# --- Combined Ingestion for Every Tracked Stock ---
+# One OR-combined, paginated NewsAPI query covers every configured stock, and each article is
+# routed to the stocks it mentions locally. Request count per refresh no longer grows with the
+# number of stocks.
+INGEST_TAG = "__all_stocks__"
+NEWS_INGEST_PAGE_SIZE = 100
+NEWS_INGEST_MAX_PAGES = 5
+
+def combined_news_query():
+    return " OR ".join(f"({stock['news_query']})" for stock in STOCKS.values())
+
+def ingest_all_stocks(days_back, news_api_key):
+    window_start = (datetime.now(timezone.utc) - timedelta(days=days_back)).strftime(NEWSAPI_TIME_FORMAT)
+    latest = NEWS_ARCHIVE.latest_published(INGEST_TAG)
+    incremental = latest is not None and latest > window_start
+
+    params = {
+        "q": combined_news_query(),
+        "language": "en",
+        "sortBy": "publishedAt",
+        "from": latest if incremental else window_start,
+        "apiKey": news_api_key,
+        "pageSize": NEWS_INGEST_PAGE_SIZE
+    }
+
+    print(f"Attempting NewsAPI.org combined ingestion for {len(STOCKS)} stocks" + (f" (since {latest})" if incremental else ""))
+    fetched, added, routed_counts = 0, 0, {}
+    for page in range(1, NEWS_INGEST_MAX_PAGES + 1):
+        try:
+            data = _request_everything({**params, "page": page})
+        except NewsAPIError as e:
+            # Plans with a result cap answer the first page past it with a 4xx
+            # ("maximumResultsReached"); the pages already archived are kept.
+            if page > 1 and (e.code == "maximumResultsReached" or 400 <= (e.status_code or 0) < 500):
+                print(f"NewsAPI.org: Paging stopped at page {page}: {e.code or e.status_code}")
+                break
+            raise
+        articles = _parse_articles(data)
+        # Archive and route each page as it arrives, so a failure on a later page keeps it
+        added += NEWS_ARCHIVE.add(articles, INGEST_TAG)
+        for stock_key, stock_articles in route_articles(articles).items():
+            NEWS_ARCHIVE.add(stock_articles, stock_key)
+            routed_counts[stock_key] = routed_counts.get(stock_key, 0) + len(stock_articles)
+        fetched += len(articles)
+        if len(articles) < NEWS_INGEST_PAGE_SIZE or fetched >= data.get("totalResults", 0):
+            break
+
+    print(f"NewsAPI.org: Ingested {fetched} articles ({added} new) in {page} request(s); "
+          f"routed to {', '.join(f'{k}={v}' for k, v in routed_counts.items()) or 'no stocks'}.")
+    return fetched
+
+def get_stock_news_entry(stock_key: str, days_back: int = 30):
+    # Runs (or reuses) the shared ingestion, then reads this stock's articles from the archive
+    query = get_stock(stock_key)["news_query"]
+    news_api_key = get_news_api_key()
+    if not news_api_key:
+        print("Fallback: NEWS_API_KEY not set. Returning mock news.")
+        return _fresh(_mock_news(query, "Key Missing", "This is a mock news article because the NewsAPI key is not configured or an error occurred."))
+
+    window_start = (datetime.now(timezone.utc) - timedelta(days=days_back)).strftime(NEWSAPI_TIME_FORMAT)
+    try:
+        ingest = NEWS_CACHE.get((INGEST_TAG, days_back), ingest_all_stocks, days_back, news_api_key)
+    except (NewsAPIError, requests.exceptions.RequestException) as e:
+        # Archived articles beat mock ones; they are served stale until an ingestion succeeds
+        articles = NEWS_ARCHIVE.recent(stock_key, limit=20, since=window_start)
+        if not articles:
+            return _fresh(_news_fallback(query, e))
+        print(f"NewsAPI.org ingestion failed ({e}); serving {len(articles)} archived articles for {stock_key}.")
+        fetched_at = NEWS_ARCHIVE.last_fetched(stock_key)
+        return CachedValue(articles, fetched_at, time.time() - fetched_at, True)
+
+    articles = NEWS_ARCHIVE.recent(stock_key, limit=20, since=window_start)
+    return CachedValue(articles, ingest.fetched_at, ingest.age, ingest.is_stale)
+
+# --- Archive Search ---
+# The index is fed incrementally from the archive, so a search never calls NewsAPI.
+NEWS_INDEX = InvertedIndex()
+_index_lock = threading.Lock()
+_index_watermark = 0 # Last archive tag rowid added to the index
+
+def sync_news_index():
+    global _index_watermark
+    with _index_lock:
+        while True:
+            rows = NEWS_ARCHIVE.tagged_since(_index_watermark)
+            if not rows:
+                return len(NEWS_INDEX)
+            for rowid, tag, article in rows:
+                NEWS_INDEX.add(article["url"], article, (tag,))
+            _index_watermark = rows[-1][0]
+
+def search_news(query: str, stock_key: str = None, limit: int = 10):
+    sync_news_index()
+    return NEWS_INDEX.search(query, limit=limit, tag=stock_key)
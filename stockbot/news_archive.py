@@ -0,0 +1,93 @@
+# stockbot/news_archive.py
+import os
+import sqlite3
+import threading
+import time
+
+# --- Local News Archive (SQLite) ---
+# Every article NewsAPI returns is stored once, deduplicated by URL, and tagged with the
+# query (later: stock) it was fetched for. Refreshes only ask NewsAPI for articles newer than
+# the latest stored publishedAt for that tag and read everything else from here.
+class NewsArchive:
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                source TEXT,
+                title TEXT,
+                content TEXT,
+                published_at TEXT,
+                event TEXT,
+                fetched_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS article_tags (
+                url TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (url, tag)
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles (published_at);
+            CREATE INDEX IF NOT EXISTS idx_article_tags_tag ON article_tags (tag);
+        """)
+        self._db.commit()
+
+    def add(self, articles, tag: str):
+        # Returns how many of `articles` were not in the archive yet
+        rows = [(a["url"], a["source"], a["title"], a["content"], a["publishedAt"], a["event"], time.time())
+                for a in articles if a.get("url") and a["url"] != "#"]
+        with self._lock:
+            before = self._db.total_changes
+            self._db.executemany("INSERT OR IGNORE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            added = self._db.total_changes - before
+            self._db.executemany("INSERT OR IGNORE INTO article_tags VALUES (?, ?)", [(row[0], tag) for row in rows])
+            self._db.commit()
+        return added
+
+    def latest_published(self, tag: str):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MAX(a.published_at) FROM articles a JOIN article_tags t ON t.url = a.url WHERE t.tag = ?",
+                (tag,)).fetchone()
+        return row[0] if row else None
+
+    def last_fetched(self, tag: str):
+        # Unix time the newest article under `tag` was archived, or None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MAX(a.fetched_at) FROM articles a JOIN article_tags t ON t.url = a.url WHERE t.tag = ?",
+                (tag,)).fetchone()
+        return row[0] if row else None
+
+    def recent(self, tag: str, limit: int = 20, since: str = None):
+        # Newest first, in the article dict shape the stock pages render
+        query = ("SELECT a.source, a.title, a.content, a.url, a.published_at, a.event FROM articles a "
+                 "JOIN article_tags t ON t.url = a.url WHERE t.tag = ?")
+        params = [tag]
+        if since:
+            query += " AND a.published_at >= ?"
+            params.append(since)
+        query += " ORDER BY a.published_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        return [{"source": source, "title": title, "content": content, "url": url,
+                 "publishedAt": published_at, "event": event}
+                for source, title, content, url, published_at, event in rows]
+
+    def tagged_since(self, tag_rowid: int, limit: int = 5000):
+        # (tag rowid, tag, article) for every tag written after `tag_rowid`. Every article is
+        # stored with at least one tag, so this doubles as the feed of newly archived articles.
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT t.rowid, t.tag, a.source, a.title, a.content, a.url, a.published_at, a.event "
+                "FROM article_tags t JOIN articles a ON a.url = t.url WHERE t.rowid > ? ORDER BY t.rowid LIMIT ?",
+                (tag_rowid, limit)).fetchall()
+        return [(rowid, tag, {"source": source, "title": title, "content": content, "url": url,
+                              "publishedAt": published_at, "event": event})
+                for rowid, tag, source, title, content, url, published_at, event in rows]
+
+    def count(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
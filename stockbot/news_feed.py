@@ -0,0 +1,93 @@
+# stockbot/news_feed.py
+import hashlib
+import json
+from html import escape
+from string import Template
+
+import streamlit as st
+
+# --- Batched News Feed Rendering ---
+# The whole two-column feed is built from one precompiled template and sent as a single
+# st.markdown element, instead of one element (and one frontend delta) per article.
+# Templates are flattened to single unindented lines: Markdown would otherwise read
+# indented HTML as a code block and a blank line as the end of the HTML block.
+def _compile(markup: str):
+    return Template("".join(line.strip() for line in markup.splitlines()))
+
+NEWS_CARD_TEMPLATE = _compile("""
+<div style="background-color: #ffffff; padding: 1rem; border-radius: 0.5rem; box-shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.1);">
+    <p style="font-size: 0.75rem; color: #6b7280;">$source | $event | $published$similar</p>
+    <h3 style="font-size: 1rem; font-weight: 600; color: #1f2937;">$title</h3>
+    <p style="font-size: 0.875rem; color: #374151;">$content...</p>
+    <p style="font-size: 0.75rem;"><a href="$url" target="_blank" rel="noopener noreferrer" style="color: #4f46e5;">Read more</a></p>
+    <div style="display: flex; align-items: center; margin-top: 0.5rem; font-size: 0.875rem;">
+        <span style="font-weight: 500;">Sentiment:</span>
+        <span style="font-weight: 700; color: $sentiment_color; margin-left: 0.25rem;">$sentiment</span>
+        <span style="font-weight: 500; margin-left: 1rem;">Action:</span>
+        <span style="font-weight: 700; color: $action_color; margin-left: 0.25rem;">$action</span>
+    </div>
+</div>
+""")
+
+# Cards fill the grid row by row: even articles on the left, odd ones on the right
+NEWS_FEED_TEMPLATE = _compile("""
+<div style="display: grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 1rem; margin-bottom: 1rem;">$cards</div>
+""")
+
+# Archive search results, also emitted as one element
+SEARCH_RESULT_TEMPLATE = _compile("""
+<li><a href="$url" target="_blank" rel="noopener noreferrer">$title</a> · $source · $published · score $score</li>
+""")
+SEARCH_RESULTS_TEMPLATE = _compile("""
+<ul style="margin-top: 0.5rem;">$items</ul>
+""")
+
+SENTIMENT_COLORS = {"positive": "#16a34a", "negative": "#dc2626"}
+ACTION_COLORS = {"BUY": "#16a34a", "SELL/SHORT": "#dc2626"}
+
+def _text(value):
+    # Escaped for HTML and kept on one line (see the Markdown note above); "$" is encoded too,
+    # since Streamlit's Markdown would otherwise render "$...$" in a title as LaTeX
+    return escape(" ".join(str(value).split())).replace("$", "&#36;")
+
+def _safe_url(url):
+    url = str(url)
+    return escape(url).replace("$", "&#36;") if url.startswith(("http://", "https://")) else "#"
+
+def news_card_html(news):
+    similar = f" | +{news['cluster_size'] - 1} similar" if news.get('cluster_size', 1) > 1 else ""
+    return NEWS_CARD_TEMPLATE.substitute(
+        source=_text(news['source']),
+        event=_text(news['event']),
+        published=_text(str(news['publishedAt'])[:10]),
+        similar=similar,
+        title=_text(news['title']),
+        content=_text(str(news['content'])[:250]),
+        url=_safe_url(news['url']),
+        sentiment_color=SENTIMENT_COLORS.get(news['sentiment'], "#f59e0b"),
+        sentiment=_text(news['sentiment'].upper()),
+        action_color=ACTION_COLORS.get(news['recommended_action'], "#3b82f6"),
+        action=_text(news['recommended_action']),
+    )
+
+def news_feed_version(processed_news):
+    payload = json.dumps(processed_news, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+@st.cache_data(max_entries=64)
+def _news_feed_html(version: str, _processed_news):
+    # Keyed on the version only; the list itself is not hashed again by Streamlit
+    return NEWS_FEED_TEMPLATE.substitute(cards="".join(news_card_html(news) for news in _processed_news))
+
+def news_feed_html(processed_news):
+    return _news_feed_html(news_feed_version(processed_news), processed_news)
+
+def search_results_html(results):
+    # results: [(score, article)] as returned by news.search_news
+    return SEARCH_RESULTS_TEMPLATE.substitute(items="".join(SEARCH_RESULT_TEMPLATE.substitute(
+        url=_safe_url(article['url']),
+        title=_text(article['title']),
+        source=_text(article['source']),
+        published=_text(str(article['publishedAt'])[:10]),
+        score=f"{score:.2f}",
+    ) for score, article in results))
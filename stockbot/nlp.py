@@ -0,0 +1,71 @@
+# stockbot/nlp.py
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from stockbot.batch_sentiment import BatchScores, article_text, score_articles
+from stockbot.config import (BASE_NEGATIVE_KEYWORDS, BASE_NEUTRAL_KEYWORDS, BASE_POSITIVE_KEYWORDS, DATA_DIR,
+                             NLP_CACHE_SETTINGS, STOCKS, get_stock)
+from stockbot.keyword_matcher import KeywordAutomaton, compile_lexicon
+from stockbot.nlp_cache import NLPResultCache
+
+# --- NLP and Action Mapping ---
+def lexicon_for(stock_key: str):
+    # Base lexicon + the stock's sector extensions + its name variants as entities.
+    # compile_lexicon is memoized, so every page and session shares one automaton per stock.
+    stock = get_stock(stock_key)
+    extensions = stock["lexicon_extensions"]
+    return compile_lexicon(
+        tuple(BASE_POSITIVE_KEYWORDS + extensions.get("positive", [])),
+        tuple(BASE_NEGATIVE_KEYWORDS + extensions.get("negative", [])),
+        tuple(BASE_NEUTRAL_KEYWORDS + extensions.get("neutral", [])),
+        tuple([stock_key.lower()] + stock["name_variants"]),
+    )
+
+# Shared by every page and session in the process
+NLP_CACHE = NLPResultCache(
+    max_entries=NLP_CACHE_SETTINGS["max_entries"],
+    disk_path=os.path.join(DATA_DIR, "nlp_cache.sqlite") if NLP_CACHE_SETTINGS["disk"] else None,
+)
+
+def score_news(articles, stock_key):
+    # Batch-scores only the articles the NLP cache has not seen for this lexicon version
+    lexicon = lexicon_for(stock_key)
+    keys = [NLP_CACHE.make_key(article, lexicon.version) for article in articles]
+    cached = NLP_CACHE.get_many(keys)
+
+    missing = [i for i, key in enumerate(keys) if key not in cached]
+    if missing:
+        batch = score_articles(lexicon, (article_text(articles[i]) for i in missing))
+        fresh = {
+            keys[i]: {"score": float(batch.scores[j]), "sentiment": str(batch.labels[j]), "has_entity": bool(batch.entity_mask[j])}
+            for j, i in enumerate(missing)
+        }
+        NLP_CACHE.put_many(fresh)
+        cached.update(fresh)
+
+    results = [cached[key] for key in keys]
+    return BatchScores(
+        np.array([result["score"] for result in results], dtype=np.float64),
+        np.array([result["sentiment"] for result in results], dtype=object),
+        np.array([result["has_entity"] for result in results], dtype=bool),
+    )
+
+# --- Stock Routing ---
+@lru_cache(maxsize=1)
+def stock_router():
+    # Every configured stock's name variants in one whole-word automaton, labelled by stock key
+    return KeywordAutomaton(
+        ((variant, stock_key) for stock_key, stock in STOCKS.items() for variant in [stock_key.lower()] + stock["name_variants"]),
+        whole_words=True,
+    )
+
+def route_articles(articles):
+    # stock_key -> articles that mention it; one article can belong to several stocks
+    router = stock_router()
+    routed = {}
+    for article in articles:
+        for stock_key in router.match_labels(article_text(article)):
+            routed.setdefault(stock_key, []).append(article)
+    return routed
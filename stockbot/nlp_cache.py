@@ -0,0 +1,70 @@
+# stockbot/nlp_cache.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+# --- Per-article NLP Result Cache ---
+# Results are keyed by a hash of the article's title + content + the lexicon version, so an
+# article is scanned once per lexicon no matter how many reruns, pages or sessions show it.
+# A bounded in-memory LRU sits in front of an optional SQLite tier that survives restarts.
+class NLPResultCache:
+    def __init__(self, max_entries: int = 10000, disk_path: str = None):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._db = None
+        self.hits = 0
+        self.misses = 0
+        if disk_path:
+            os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS nlp_results (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._db.commit()
+
+    @staticmethod
+    def make_key(article, lexicon_version: str):
+        text = "\x00".join((str(article.get("title", "")), str(article.get("content", "")), lexicon_version))
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_many(self, keys):
+        # Returns {key: result} for every key found in memory or on disk
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+
+            missing = [key for key in keys if key not in found]
+            if missing and self._db is not None:
+                placeholders = ",".join("?" * len(missing))
+                rows = self._db.execute(f"SELECT key, value FROM nlp_results WHERE key IN ({placeholders})", missing).fetchall()
+                for key, value in rows:
+                    found[key] = json.loads(value)
+                    self._remember(key, found[key])
+
+            self.hits += len(found)
+            self.misses += len(set(keys)) - len(found)
+        return found
+
+    def put_many(self, results):
+        with self._lock:
+            for key, value in results.items():
+                self._remember(key, value)
+            if self._db is not None and results:
+                self._db.executemany("INSERT OR REPLACE INTO nlp_results (key, value) VALUES (?, ?)",
+                                     [(key, json.dumps(value)) for key, value in results.items()])
+                self._db.commit()
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries_in_memory": len(self._entries)}
@@ -0,0 +1,131 @@
+# stockbot/ohlc_store.py
+import os
+import threading
+from datetime import timedelta
+
+import pandas as pd
+import yfinance as yf
+
+from stockbot.config import DATA_DIR
+
+# --- Persistent OHLC Store (Parquet, one file per symbol/interval) ---
+# Bars survive restarts and are shared by every Streamlit process on the host, so a fetch
+# only has to pull bars newer than the last stored timestamp.
+OHLC_DIR = os.path.join(DATA_DIR, "ohlc")
+OHLC_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# yfinance only serves recent intraday history; asking for older bars returns nothing.
+INTRADAY_LOOKBACK = {'1m': timedelta(days=7), '5m': timedelta(days=59), '15m': timedelta(days=59),
+                     '30m': timedelta(days=59), '60m': timedelta(days=729)}
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+def _lock_for(path: str):
+    with _locks_guard:
+        return _locks.setdefault(path, threading.Lock())
+
+def store_path(yf_symbol: str, interval: str):
+    safe_symbol = yf_symbol.replace("/", "_").replace("^", "_")
+    return os.path.join(OHLC_DIR, interval, f"{safe_symbol}.parquet")
+
+def load_bars(yf_symbol: str, interval: str):
+    path = store_path(yf_symbol, interval)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=OHLC_COLUMNS)
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        print(f"OHLC store: Could not read {path}: {e}. Ignoring stored bars.")
+        return pd.DataFrame(columns=OHLC_COLUMNS)
+
+def save_bars(yf_symbol: str, interval: str, df: pd.DataFrame):
+    path = store_path(yf_symbol, interval)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    df.to_parquet(tmp_path)
+    os.replace(tmp_path, path) # Atomic swap so readers never see a half-written file
+
+def merge_bars(stored: pd.DataFrame, fresh: pd.DataFrame):
+    if stored.empty:
+        return fresh.sort_index()
+    if fresh.empty:
+        return stored
+    if stored.index.tz is not None and fresh.index.tz is not None:
+        fresh = fresh.tz_convert(stored.index.tz)
+    merged = pd.concat([stored, fresh])
+    # The last stored bar may have been a partial (in-progress) bar; keep the fresh copy.
+    merged = merged[~merged.index.duplicated(keep="last")]
+    return merged.sort_index()
+
+def _normalize(df: pd.DataFrame):
+    df = df[OHLC_COLUMNS].copy()
+    df.index.name = 'Date'
+    return df
+
+def covers_period(df: pd.DataFrame, period: str):
+    if df.empty:
+        return False
+    if period == "max":
+        return True
+    if period.endswith("d"):
+        return df.index.normalize().nunique() >= int(period[:-1])
+    if period.endswith("mo"):
+        offset = pd.DateOffset(months=int(period[:-2]))
+    elif period.endswith("y"):
+        offset = pd.DateOffset(years=int(period[:-1]))
+    else:
+        return True
+    # A week of slack absorbs weekends and exchange holidays at the start of the window
+    return df.index[0] <= df.index[-1] - offset + pd.Timedelta(days=7)
+
+def fetch_bars(yf_symbol: str, interval: str, period: str):
+    # Reads the local store first and asks yfinance only for bars at or after the last
+    # stored timestamp. Falls back to the full `period` when nothing usable is stored.
+    path = store_path(yf_symbol, interval)
+    with _lock_for(path):
+        stored = load_bars(yf_symbol, interval)
+        ticker = yf.Ticker(yf_symbol)
+
+        start = None
+        if covers_period(stored, period):
+            start = stored.index[-1]
+            lookback = INTRADAY_LOOKBACK.get(interval)
+            if lookback is not None and start < pd.Timestamp.now(tz=start.tz) - lookback:
+                start = None # Gap is older than yfinance keeps; refetch the whole period
+        elif not stored.empty:
+            print(f"OHLC store: Stored {yf_symbol} ({interval}) bars do not cover {period}. Refetching.")
+
+        try:
+            if start is not None:
+                print(f"OHLC store: Fetching {yf_symbol} ({interval}) bars since {start}")
+                fresh = ticker.history(start=start, interval=interval)
+            else:
+                print(f"OHLC store: Fetching {yf_symbol} ({interval}) for period {period}")
+                fresh = ticker.history(period=period, interval=interval)
+        except Exception as e:
+            print(f"OHLC store: yfinance fetch failed for {yf_symbol} ({interval}): {e}. Using stored bars.")
+            return stored
+
+        if fresh.empty:
+            return stored
+
+        merged = merge_bars(stored, _normalize(fresh))
+        save_bars(yf_symbol, interval, merged)
+        return merged
+
+def slice_period(df: pd.DataFrame, period: str):
+    # Trims stored bars to the window yfinance would have returned for `period`.
+    if df.empty or period == "max":
+        return df
+    if period.endswith("d"):
+        # '1d'/'5d' mean trading sessions, not calendar days
+        sessions = df.index.normalize().unique()[-int(period[:-1]):]
+        return df[df.index.normalize().isin(sessions)]
+    if period.endswith("mo"):
+        offset = pd.DateOffset(months=int(period[:-2]))
+    elif period.endswith("y"):
+        offset = pd.DateOffset(years=int(period[:-1]))
+    else:
+        return df
+    return df[df.index > df.index[-1] - offset]
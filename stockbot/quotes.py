@@ -0,0 +1,38 @@
+# stockbot/quotes.py
+import pandas as pd
+import streamlit as st
+import yfinance as yf
+
+# --- Batched Quote Service (yfinance) ---
+# One yf.download call returns daily bars for every ticker at once, so the landing page
+# no longer pays a separate `.info` round trip per card. The last non-empty close of the
+# current session is the live price while the market is open.
+@st.cache_data(ttl=5 * 60) # Cache for 5 minutes
+def get_last_prices(tickers: tuple):
+    prices = {ticker: None for ticker in tickers}
+    if not tickers:
+        return prices
+
+    print(f"Attempting yfinance batched quotes for: {', '.join(tickers)}")
+    try:
+        df = yf.download(list(tickers), period="5d", interval="1d", group_by="column",
+                         auto_adjust=False, progress=False, threads=True)
+    except Exception as e:
+        print(f"Fallback: yfinance batched quotes failed: {e}")
+        return prices
+
+    if df.empty:
+        print("yfinance: No quotes returned for batched request.")
+        return prices
+
+    close = df["Close"]
+    if isinstance(close, pd.Series): # Single-ticker downloads come back without a ticker level
+        close = close.to_frame(name=tickers[0])
+    last_close = close.ffill().iloc[-1]
+
+    for ticker in tickers:
+        price = last_close.get(ticker)
+        if price is not None and pd.notna(price):
+            prices[ticker] = float(price)
+    print(f"yfinance: Successfully fetched {sum(p is not None for p in prices.values())}/{len(tickers)} batched quotes.")
+    return prices
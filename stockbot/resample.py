@@ -0,0 +1,47 @@
+# stockbot/resample.py
+import pandas as pd
+
+from stockbot.ohlc_store import slice_period
+
+# --- OHLCV Resampling Engine ---
+# Each symbol keeps two base-resolution series (5m intraday, 1d daily). Every timeframe on
+# the radio is derived from one of them locally, so switching timeframes is not a network call.
+BASE_PERIODS = {'5m': '1mo', '1d': '1y'} # How much history each base series keeps warm
+
+# timeframe -> (base interval, resample rule or None, display period)
+TIMEFRAME_VIEWS = {
+    '5m': ('5m', None, '1d'),
+    # Every stored 5m bar; long enough to need chart decimation, zooming and WebGL
+    '5m all': ('5m', None, 'max'),
+    '1d': ('5m', '60m', '5d'),
+    '1w': ('1d', None, '1mo'),
+    '1m': ('1d', None, '3mo'),
+    '1y': ('1d', None, '1y'),
+}
+
+# Named rules for views that are coarser than the stored base series
+RESAMPLE_RULES = {'60m': '60min'}
+
+OHLCV_AGG = {"Open": "first", "High": "max", "Low": "min", "Close": "last", "Volume": "sum"}
+
+def resample_ohlcv(df: pd.DataFrame, rule: str):
+    if df.empty:
+        return df
+    rule = RESAMPLE_RULES.get(rule, rule)
+    # Intraday buckets are anchored on the first bar (09:15 IST on NSE) like yfinance's 60m
+    # bars; 24h is a whole number of buckets so every session lines up the same way.
+    origin = "start" if isinstance(pd.tseries.frequencies.to_offset(rule), pd.offsets.Tick) else "start_day"
+    out = df.resample(rule, origin=origin, label="left", closed="left").agg(OHLCV_AGG)
+    out = out.dropna(subset=["Open"]) # Drop buckets that fall outside trading hours
+    out.index.name = 'Date'
+    return out
+
+def base_interval_for(timeframe: str):
+    return TIMEFRAME_VIEWS.get(timeframe, TIMEFRAME_VIEWS['1y'])[0]
+
+def timeframe_view(base_df: pd.DataFrame, timeframe: str):
+    _, rule, period = TIMEFRAME_VIEWS.get(timeframe, TIMEFRAME_VIEWS['1y'])
+    df = slice_period(base_df, period) # Trim first so only the visible window is aggregated
+    if rule is not None:
+        df = resample_ohlcv(df, rule)
+    return df
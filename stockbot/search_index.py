@@ -0,0 +1,82 @@
+# stockbot/search_index.py
+import math
+import re
+import threading
+
+# --- Full-text Search over the News Archive ---
+# In-process inverted index with positional postings (term -> {doc id: [positions]}), BM25
+# ranking and "quoted phrase" matching. Documents are added incrementally as they arrive.
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_PHRASE_RE = re.compile(r'"([^"]+)"')
+
+def tokenize(text: str):
+    return _TOKEN_RE.findall(text.lower())
+
+class InvertedIndex:
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._postings = {}
+        self._doc_lengths = {}
+        self._docs = {} # doc id -> (article, tags)
+        self._total_length = 0
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add(self, doc_id, article, tags=()):
+        tokens = tokenize(f"{article.get('title', '')} {article.get('content', '')}")
+        with self._lock:
+            if doc_id in self._docs:
+                self._docs[doc_id][1].update(tags) # Known article, maybe newly routed to a stock
+                return False
+            self._docs[doc_id] = (article, set(tags))
+            self._doc_lengths[doc_id] = len(tokens)
+            self._total_length += len(tokens)
+            for position, term in enumerate(tokens):
+                self._postings.setdefault(term, {}).setdefault(doc_id, []).append(position)
+        return True
+
+    def _has_phrase(self, doc_id, phrase_terms):
+        first = self._postings[phrase_terms[0]][doc_id]
+        rest = [set(self._postings[term][doc_id]) for term in phrase_terms[1:]]
+        return any(all(start + offset + 1 in positions for offset, positions in enumerate(rest)) for start in first)
+
+    def search(self, query: str, limit: int = 10, tag: str = None):
+        # Returns [(score, article)] best first. Every quoted phrase must appear verbatim;
+        # all terms (inside and outside quotes) contribute to the BM25 score.
+        phrases = [tokenize(p) for p in _PHRASE_RE.findall(query)]
+        phrases = [p for p in phrases if p]
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            n_docs = len(self._docs)
+            if n_docs == 0:
+                return []
+            avg_length = self._total_length / n_docs
+            scores = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, positions in postings.items():
+                    tf = len(positions)
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / avg_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+            results = []
+            for doc_id, score in scores.items():
+                article, tags = self._docs[doc_id]
+                if tag is not None and tag not in tags:
+                    continue
+                if phrases and not all(all(doc_id in self._postings.get(t, ()) for t in phrase)
+                                       and self._has_phrase(doc_id, phrase) for phrase in phrases):
+                    continue
+                results.append((score, article))
+
+        results.sort(key=lambda result: result[0], reverse=True)
+        return results[:limit]
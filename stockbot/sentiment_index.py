@@ -0,0 +1,172 @@
+# stockbot/sentiment_index.py
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import pandas as pd
+
+from stockbot.config import DATA_DIR, SENTIMENT_INDEX_SETTINGS
+
+# --- Time-decayed Rolling Sentiment Index ---
+# Each stock keeps an exponentially decayed average of article sentiment (+1/0/-1). A new
+# article is folded in in O(1); nothing is re-derived from the article list on a rerun.
+# The index is read as of the current time: score and weight keep decaying after the last
+# article and are averaged with a few neutral prior articles, so a stock with no news fades
+# back to neutral instead of keeping its last reading forever.
+SENTIMENT_VALUES = {"positive": 1.0, "negative": -1.0, "neutral": 0.0}
+
+class DecayedSentiment:
+    def __init__(self, half_life_seconds: float, score: float = 0.0, weight: float = 0.0, last_ts: float = None):
+        self.half_life_seconds = half_life_seconds
+        self.score = score # Decayed sum of sentiment values
+        self.weight = weight # Decayed article count
+        self.last_ts = last_ts
+
+    def update(self, ts: float, value: float):
+        if self.last_ts is None:
+            self.last_ts = ts
+        if ts >= self.last_ts:
+            decay = 0.5 ** ((ts - self.last_ts) / self.half_life_seconds)
+            self.score = self.score * decay + value
+            self.weight = self.weight * decay + 1.0
+            self.last_ts = ts
+        else:
+            # A late article counts as much as it would have had it arrived on time
+            decay = 0.5 ** ((self.last_ts - ts) / self.half_life_seconds)
+            self.score += value * decay
+            self.weight += decay
+
+    def index_at(self, now: float = None, prior_weight: float = SENTIMENT_INDEX_SETTINGS["prior_weight"]):
+        if self.last_ts is None:
+            return 0.0
+        now = time.time() if now is None else now
+        decay = 0.5 ** (max(now - self.last_ts, 0.0) / self.half_life_seconds)
+        return self.score * decay / (self.weight * decay + prior_weight)
+
+    def label(self, now: float = None, threshold: float = SENTIMENT_INDEX_SETTINGS["label_threshold"]):
+        index = self.index_at(now)
+        if index > threshold:
+            return "positive"
+        elif index < -threshold:
+            return "negative"
+        return "neutral"
+
+    def to_dict(self):
+        return {"half_life_seconds": self.half_life_seconds, "score": self.score,
+                "weight": self.weight, "last_ts": self.last_ts}
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(state["half_life_seconds"], state["score"], state["weight"], state["last_ts"])
+
+def published_ts(article):
+    try:
+        return pd.Timestamp(article.get("publishedAt")).timestamp()
+    except (TypeError, ValueError):
+        return time.time() # Mock articles carry "N/A" or a naive local time
+
+class SentimentIndexStore:
+    # Per-stock index state (small JSON, rewritten) plus two append-only logs: article keys
+    # already folded in, and the index history as one point per update. An update appends
+    # only what is new, so its cost does not grow with history; a log is compacted down to
+    # its cap once it reaches twice that, which keeps appends amortized O(1).
+    def __init__(self, half_life_hours: float = SENTIMENT_INDEX_SETTINGS["half_life_hours"],
+                 max_seen: int = SENTIMENT_INDEX_SETTINGS["max_seen_articles"],
+                 max_points: int = SENTIMENT_INDEX_SETTINGS["max_series_points"]):
+        self.half_life_seconds = half_life_hours * 60 * 60
+        self.max_seen = max_seen
+        self.max_points = max_points
+        self._lock = threading.Lock()
+        self._states = {} # stock_key -> (DecayedSentiment, seen keys deque, seen set, series points deque)
+        self._log_lines = {} # log path -> lines in the file, to know when to compact
+
+    def _path(self, stock_key, suffix):
+        return os.path.join(DATA_DIR, "sentiment", f"{stock_key}{suffix}")
+
+    def _read_log(self, path, cap):
+        if not os.path.exists(path):
+            self._log_lines[path] = 0
+            return []
+        with open(path) as f:
+            lines = [line.rstrip("\n") for line in f if line.strip()]
+        self._log_lines[path] = len(lines)
+        return lines[-cap:]
+
+    def _append_log(self, path, lines, kept):
+        # Appends lines; once the file holds twice its cap it is rewritten with `kept` only
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if self._log_lines.get(path, 0) + len(lines) >= 2 * kept.maxlen:
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                f.writelines(f"{line}\n" for line in kept)
+            os.replace(tmp_path, path)
+            self._log_lines[path] = len(kept)
+            return
+        with open(path, "a") as f:
+            f.writelines(f"{line}\n" for line in lines)
+        self._log_lines[path] = self._log_lines.get(path, 0) + len(lines)
+
+    def _load(self, stock_key):
+        if stock_key in self._states:
+            return self._states[stock_key]
+        index = DecayedSentiment(self.half_life_seconds)
+        path = self._path(stock_key, ".json")
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    index = DecayedSentiment.from_dict(json.load(f)["index"])
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Sentiment index: Could not read {path}: {e}. Starting fresh.")
+        seen_order = deque(self._read_log(self._path(stock_key, ".seen.log"), self.max_seen), maxlen=self.max_seen)
+        points = deque(self._read_log(self._path(stock_key, ".series.jsonl"), self.max_points), maxlen=self.max_points)
+        self._states[stock_key] = (index, seen_order, set(seen_order), points)
+        return self._states[stock_key]
+
+    def _save(self, stock_key, index, seen_order, new_keys, points, point):
+        path = self._path(stock_key, ".json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"index": index.to_dict()}, f)
+        os.replace(tmp_path, path)
+        self._append_log(self._path(stock_key, ".seen.log"), new_keys, seen_order)
+        self._append_log(self._path(stock_key, ".series.jsonl"), [point], points)
+
+    def get(self, stock_key):
+        with self._lock:
+            return self._load(stock_key)[0]
+
+    def update(self, stock_key, scored_articles):
+        # scored_articles: iterable of (article key, unix timestamp, sentiment label).
+        # Articles already folded in are skipped, so reruns over the same list are no-ops.
+        with self._lock:
+            index, seen_order, seen, points = self._load(stock_key)
+            new = [(ts, key, sentiment) for key, ts, sentiment in scored_articles if key not in seen]
+            if not new:
+                return index
+            new_keys = []
+            for ts, key, sentiment in sorted(new):
+                index.update(ts, SENTIMENT_VALUES.get(sentiment, 0.0))
+                if len(seen_order) == seen_order.maxlen:
+                    seen.discard(seen_order[0])
+                seen_order.append(key)
+                seen.add(key)
+                new_keys.append(key)
+            point = json.dumps([index.last_ts, index.index_at(index.last_ts), index.weight])
+            points.append(point)
+            self._save(stock_key, index, seen_order, new_keys, points, point)
+            return index
+
+    def series(self, stock_key):
+        # Index history as a DataFrame ("Sentiment", "Weight"), one row per update
+        with self._lock:
+            points = [json.loads(point) for point in self._load(stock_key)[3]]
+        df = pd.DataFrame(points, columns=["ts", "Sentiment", "Weight"])
+        df.index = pd.DatetimeIndex(pd.to_datetime(df.pop("ts"), unit="s", utc=True), name="Date")
+        df = df[~df.index.duplicated(keep="last")]
+        return df.sort_index()
+
+# Shared by every page and session in the process
+SENTIMENT_INDEX = SentimentIndexStore()
@@ -0,0 +1,59 @@
+# stockbot/signals.py
+import hashlib
+from functools import lru_cache
+
+import numpy as np
+
+# --- Deterministic Signal Engine ---
+# A signal is a pure function of (article, sentiment, recent price volatility): the same
+# inputs always give bit-identical numbers, so processed signals can be memoized by article
+# hash and compared across runs.
+
+# sentiment -> (action, confidence range, stop-loss % range, take-profit % range)
+SIGNAL_RANGES = {
+    "positive": ("BUY", (0.7, 0.9), (2.5, 3.5), (5.0, 7.0)),
+    "negative": ("SELL/SHORT", (0.7, 0.9), (3.0, 4.0), (6.0, 8.0)),
+    "neutral": ("HOLD", (0.4, 0.6), (1.0, 2.0), (2.0, 4.0)),
+}
+VOLATILITY_LOOKBACK = 20 # Daily bars
+FULL_RANGE_VOLATILITY = 0.03 # Daily return std at which stops sit at the top of their range
+
+def article_key(article):
+    text = "\x00".join(str(article.get(field, "")) for field in ("title", "content", "url"))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def _unit(key: str, field: str):
+    # Uniform value in [0, 1) derived from the article hash; replaces np.random draws
+    digest = hashlib.blake2b(f"{key}:{field}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2 ** 64
+
+def _lerp(bounds, u):
+    return round(bounds[0] + (bounds[1] - bounds[0]) * u, 2)
+
+def price_volatility(ohlc_df):
+    # Std of daily close-to-close log returns over the lookback, rounded so that tiny float noise
+    # between refreshes does not defeat the memo below. None when there is not enough data.
+    if ohlc_df is None or len(ohlc_df) < 3 or "Close" not in ohlc_df:
+        return None
+    returns = np.diff(np.log(ohlc_df["Close"].to_numpy(dtype=np.float64)[-(VOLATILITY_LOOKBACK + 1):]))
+    volatility = float(np.std(returns, ddof=1))
+    return round(volatility, 4) if np.isfinite(volatility) else None
+
+@lru_cache(maxsize=4096)
+def _signal_values(key: str, sentiment: str, volatility):
+    action, confidence_range, stop_range, take_range = SIGNAL_RANGES.get(sentiment, SIGNAL_RANGES["neutral"])
+    if volatility is None:
+        stop_u, take_u = _unit(key, "stop_loss"), _unit(key, "take_profit")
+    else:
+        # Wider stops and targets when the stock is moving more
+        stop_u = take_u = min(volatility / FULL_RANGE_VOLATILITY, 1.0)
+    return action, _lerp(confidence_range, _unit(key, "confidence")), _lerp(stop_range, stop_u), _lerp(take_range, take_u)
+
+def map_news_to_action(article, sentiment, volatility=None):
+    action, confidence, stop_loss, take_profit = _signal_values(article_key(article), sentiment, volatility)
+    return {
+        "recommended_action": action,
+        "confidence": confidence,
+        "stop_loss": stop_loss,
+        "take_profit": take_profit
+    }
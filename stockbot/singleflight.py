@@ -0,0 +1,54 @@
+# stockbot/singleflight.py
+import threading
+
+# --- Request Coalescing (single-flight) ---
+# Concurrent callers asking for the same key wait on the one in-flight upstream call and
+# share its result (or its exception) instead of each issuing their own request. Only calls
+# that overlap are coalesced; caching the result is left to the caller.
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.upstream_calls = 0 # Calls that actually ran
+        self.shared_calls = 0 # Callers that piggybacked on an in-flight call
+
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.upstream_calls += 1
+            else:
+                self.shared_calls += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self):
+        with self._lock:
+            return {"upstream_calls": self.upstream_calls, "shared_calls": self.shared_calls,
+                    "in_flight": len(self._calls)}
+
+# Shared by every page and session in the process
+UPSTREAM_FETCHES = SingleFlight()
@@ -0,0 +1,374 @@
+# stockbot/stock_page.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from stockbot.config import CACHE_SETTINGS, SENTIMENT_INDEX_SETTINGS, get_stock
+from stockbot.dedup import collapse_near_duplicates
+from stockbot.downsample import aggregate_ohlc, bar_budget, lttb, zoom_window
+from stockbot.figure_cache import FIGURE_CACHE, data_version, render_figure_json
+from stockbot.market_data import get_base_ohlc_yf, get_historical_ohlc_yf, get_indicators, get_live_price_entry
+from stockbot.news import get_news_api_key, get_stock_news_entry, search_news
+from stockbot.news_feed import news_feed_html, search_results_html
+from stockbot.nlp import score_news
+from stockbot.resample import base_interval_for
+from stockbot.sentiment_index import SENTIMENT_INDEX, published_ts
+from stockbot.signals import article_key, map_news_to_action, price_volatility
+from stockbot.swr_cache import format_age
+from stockbot.webgl_traces import RANGE_SELECTOR, line_trace, use_webgl, webgl_candle_traces
+
+# --- Shared Stock Dashboard ---
+# Every page in pages/ is a thin wrapper around render_stock_page; the stock-specific parts
+# (symbols, name variants, lexicon extensions, mock ranges) live in stockbot/config.py.
+
+TIMEFRAME_OPTIONS = ["5m", "5m all", "1d", "1w", "1m", "1y"]
+DEFAULT_TIMEFRAME = "1y"
+
+# Overlay name -> (indicator column, line color, dash) traces drawn on the candlestick chart
+INDICATOR_OVERLAYS = {
+    "SMA 20": [("SMA_20", "#f59e0b", "solid")],
+    "EMA 50": [("EMA_50", "#8b5cf6", "solid")],
+    "Bollinger Bands": [("BB_upper", "#94a3b8", "dot"), ("BB_mid", "#64748b", "dash"), ("BB_lower", "#94a3b8", "dot")],
+    "VWAP": [("VWAP", "#0ea5e9", "dash")],
+}
+
+def _timeframe_key(stock_key):
+    return f"timeframe_{stock_key}"
+
+def selected_timeframe(stock_key):
+    # The radio's value is in session_state before the script reruns, so the chart data can be
+    # fetched together with everything else before the radio itself is drawn.
+    return st.session_state.get(_timeframe_key(stock_key), DEFAULT_TIMEFRAME)
+
+def fragment(run_every=None):
+    # Sections decorated with this rerun on their own when their widgets change (or every
+    # `run_every` seconds) instead of rerunning the whole page. st.fragment is Streamlit
+    # >= 1.37; older releases have st.experimental_fragment, or no fragments at all.
+    decorator = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    if decorator is None:
+        return lambda fn: fn
+    return decorator(run_every=run_every)
+
+def prefetch_page_data(stock_key, timeframe):
+    # Fans the page's independent data dependencies out to a thread pool, so a cold load
+    # costs the slowest single call instead of the sum of all of them. The sections below
+    # read the same calls back from the warm caches, also when they rerun on their own.
+    ctx = get_script_run_ctx()
+
+    def attach_ctx():
+        # Lets st.cache_data inside the workers see the session that asked for the data
+        add_script_run_ctx(threading.current_thread(), ctx)
+
+    with ThreadPoolExecutor(max_workers=5, thread_name_prefix="stockbot-page", initializer=attach_ctx) as pool:
+        futures = [
+            pool.submit(get_live_price_entry, stock_key, "BSE"),
+            pool.submit(get_live_price_entry, stock_key, "NSE"),
+            # Assume NSE for graphs by default
+            pool.submit(get_base_ohlc_yf, stock_key, base_interval_for(timeframe), "NSE"),
+            # Daily bars feed the signal engine's volatility input whatever the chart shows
+            pool.submit(get_base_ohlc_yf, stock_key, "1d", "NSE"),
+            # One combined NewsAPI ingestion serves every stock page
+            pool.submit(get_stock_news_entry, stock_key),
+        ]
+        for future in futures:
+            future.result()
+
+def _age_caption(what, age, is_stale):
+    caption = f"{what} updated {format_age(age)}"
+    return f"{caption} · refreshing in the background" if is_stale else caption
+
+def render_price_box(bse_entry, nse_entry):
+    st.markdown("---")
+    st.subheader("Current Market Prices")
+
+    bse_price, nse_price = bse_entry.value, nse_entry.value
+
+    if bse_price is not None and nse_price is not None:
+        st.markdown(f"""
+        <div style="background-color: #f0f8ff; padding: 1rem; border-radius: 0.5rem; display: flex; justify-content: space-around; align-items: center; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
+            <div style="text-align: center;">
+                <span style="font-size: 1.2rem; font-weight: bold; color: #4CAF50;">BSE:</span>
+                <span style="font-size: 1.5rem; font-weight: bold; color: #333;">₹{bse_price:.2f}</span>
+            </div>
+            <div style="text-align: center;">
+                <span style="font-size: 1.2rem; font-weight: bold; color: #2196F3;">NSE:</span>
+                <span style="font-size: 1.5rem; font-weight: bold; color: #333;">₹{nse_price:.2f}</span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        st.caption(_age_caption("Prices", max(bse_entry.age, nse_entry.age), bse_entry.is_stale or nse_entry.is_stale))
+    else:
+        st.info("Attempting to fetch live prices (using mock if API fails)... Please ensure internet connection and correct stock symbols.")
+
+# --- Figure Builders (only called on a figure cache miss) ---
+CHART_HEIGHT = 400
+
+def build_candlestick_figure(candles, overlay_values, overlays):
+    if use_webgl(len(candles)):
+        fig_candlestick = go.Figure(data=webgl_candle_traces(candles))
+    else:
+        fig_candlestick = go.Figure(data=[go.Candlestick(
+            x=candles.index, # Use index (Date) for x-axis
+            open=candles['Open'],
+            high=candles['High'],
+            low=candles['Low'],
+            close=candles['Close'],
+            increasing_line_color='green',
+            decreasing_line_color='red'
+        )])
+    overlay_trace = line_trace(len(overlay_values))
+    for overlay in overlays:
+        for column, color, dash in INDICATOR_OVERLAYS[overlay]:
+            fig_candlestick.add_trace(overlay_trace(
+                x=overlay_values.index, y=overlay_values[column], mode='lines', name=column,
+                line=dict(color=color, width=1.2, dash=dash)
+            ))
+    fig_candlestick.update_layout(
+        xaxis_rangeslider_visible=False,
+        xaxis_rangeselector=RANGE_SELECTOR,
+        xaxis_title="Date",
+        yaxis_title="Price (₹)",
+        height=CHART_HEIGHT,
+        margin=dict(l=20, r=20, t=20, b=20)
+    )
+    return fig_candlestick
+
+def build_line_figure(close_line):
+    fig_line = go.Figure(data=line_trace(len(close_line))(
+        x=close_line.index, # Use index (Date) for x-axis
+        y=close_line,
+        mode='lines',
+        line=dict(color='#4f46e5', width=2)
+    ))
+    fig_line.update_layout(
+        xaxis_rangeselector=RANGE_SELECTOR,
+        xaxis_title="Date",
+        yaxis_title="Close Price (₹)",
+        height=CHART_HEIGHT,
+        margin=dict(l=20, r=20, t=20, b=20)
+    )
+    return fig_line
+
+def zoom_to_window(stock_key, timeframe, stock_data, high_res=False):
+    # Date-range slider shown when there are more bars than the candle budget; the chosen
+    # window is what gets decimated, so zooming in brings back full resolution. It pages
+    # bars in from the server, while the charts' range selector buttons zoom client-side.
+    if len(stock_data) <= bar_budget("candles", high_res=high_res):
+        return stock_data
+    index = stock_data.index.tz_localize(None) if stock_data.index.tz is not None else stock_data.index
+    first, last = index[0].to_pydatetime(), index[-1].to_pydatetime()
+    start, end = st.slider("Zoom window", min_value=first, max_value=last, value=(first, last),
+                           format="YYYY-MM-DD HH:mm", key=f"zoom_{stock_key}_{timeframe}")
+    return zoom_window(stock_data, start, end)
+
+def render_charts(stock_key, display_name, stock_data):
+    # Timeframe Controls
+    st.subheader("Select Timeframe:")
+    st.radio(
+        "Timeframe",
+        TIMEFRAME_OPTIONS,
+        index=TIMEFRAME_OPTIONS.index(DEFAULT_TIMEFRAME),
+        key=_timeframe_key(stock_key),
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+
+    overlays = st.multiselect("Indicator overlays", list(INDICATOR_OVERLAYS), key=f"overlays_{stock_key}")
+    high_res = st.toggle("High-resolution charts (WebGL)", key=f"high_res_{stock_key}",
+                         help="Sends every bar in the window and draws long series with WebGL.")
+
+    # --- Graphs Section (Stacked Vertically) ---
+    st.markdown("---")
+    st.subheader(f"Price Charts for {display_name}")
+
+    if not stock_data.empty:
+        timeframe = selected_timeframe(stock_key)
+        indicators = get_indicators(stock_key, timeframe)
+        visible = zoom_to_window(stock_key, timeframe, stock_data, high_res)
+        # Decimate to what the chart can show; a narrow enough zoom window is drawn in full
+        candles = aggregate_ohlc(visible, bar_budget("candles", high_res=high_res))
+        close_line = lttb(visible['Close'], bar_budget("line", high_res=high_res))
+        if len(candles) < len(visible):
+            st.caption(f"Showing {len(candles)} candles for {len(visible)} bars. Narrow the window for full resolution.")
+
+        # Candlestick Chart
+        st.markdown("### Candlestick Chart")
+        overlay_columns = [column for overlay in overlays for column, _, _ in INDICATOR_OVERLAYS[overlay]]
+        overlay_values = indicators.reindex(candles.index)[overlay_columns]
+        candle_key = (stock_key, timeframe, "candles", data_version(candles, overlay_values, extra=tuple(overlays)))
+        render_figure_json(FIGURE_CACHE.get(candle_key, build_candlestick_figure, candles, overlay_values, overlays),
+                           CHART_HEIGHT, f"{stock_key}-candles")
+
+        latest = indicators.iloc[-1]
+        rsi_col, macd_col, atr_col = st.columns(3)
+        rsi_col.metric("RSI (14)", f"{latest['RSI_14']:.1f}" if pd.notna(latest['RSI_14']) else "N/A")
+        macd_col.metric("MACD histogram", f"{latest['MACD_hist']:+.2f}" if pd.notna(latest['MACD_hist']) else "N/A")
+        atr_col.metric("ATR (14)", f"₹{latest['ATR_14']:.2f}" if pd.notna(latest['ATR_14']) else "N/A")
+
+        # Normal Line Graph
+        st.markdown("### Normal Line Graph (Close Price)")
+        line_key = (stock_key, timeframe, "line", data_version(close_line.to_frame()))
+        render_figure_json(FIGURE_CACHE.get(line_key, build_line_figure, close_line),
+                           CHART_HEIGHT, f"{stock_key}-line")
+    else:
+        st.warning(f"No stock data available for {display_name} for the selected timeframe. Check yfinance compatibility for this symbol.")
+
+def process_news(stock_key, raw_articles, daily_ohlc=None):
+    processed_news = []
+    latest_trading_signal = {
+        "ticker": stock_key,
+        "sentiment": "N/A",
+        "sentiment_index": round(SENTIMENT_INDEX.get(stock_key).index_at(), 3),
+        "event": "N/A",
+        "confidence": 0.00,
+        "recommended_action": "HOLD",
+        "stop_loss": 0.00,
+        "take_profit": 0.00
+    }
+    if not raw_articles:
+        return processed_news, latest_trading_signal
+
+    # Score every article in one vectorized batch (sentiment labels + entity hits)
+    batch = score_news(raw_articles, stock_key)
+    volatility = price_volatility(daily_ohlc)
+
+    # Fold articles into the stock's rolling sentiment index; ones already seen are skipped
+    sentiment_index = SENTIMENT_INDEX.update(stock_key, (
+        (article_key(news_item), published_ts(news_item), str(batch.labels[i]))
+        for i, news_item in enumerate(raw_articles) if news_item["url"] != "#"
+    ))
+
+    for i, news_item in enumerate(raw_articles):
+        sentiment = str(batch.labels[i])
+        action_data = map_news_to_action(news_item, sentiment, volatility)
+
+        processed_news.append({
+            "source": news_item["source"],
+            "title": news_item["title"],
+            "content": news_item["content"],
+            "url": news_item["url"],
+            "publishedAt": news_item["publishedAt"],
+            "sentiment": sentiment,
+            "event": news_item["event"],
+            "recommended_action": action_data["recommended_action"],
+            "confidence": action_data["confidence"],
+            "cluster_size": news_item.get("cluster_size", 1)
+        })
+
+    # The trading bot output reads the maintained index; the newest article supplies the event
+    latest_item = raw_articles[0]
+    now = time.time()
+    index_sentiment = sentiment_index.label(now)
+    action_data = map_news_to_action(latest_item, index_sentiment, volatility)
+    latest_trading_signal = {
+        "ticker": stock_key if batch.entity_mask[0] else "N/A",
+        "sentiment": index_sentiment,
+        "sentiment_index": round(sentiment_index.index_at(now), 3),
+        "event": latest_item["event"],
+        "confidence": action_data["confidence"],
+        "recommended_action": action_data["recommended_action"],
+        "stop_loss": action_data["stop_loss"],
+        "take_profit": action_data["take_profit"]
+    }
+    return processed_news, latest_trading_signal
+
+def render_sentiment_index(stock_key, display_name):
+    sentiment_index = SENTIMENT_INDEX.get(stock_key)
+    st.metric(f"Rolling sentiment index for {display_name} ({SENTIMENT_INDEX_SETTINGS['half_life_hours']}h half-life)",
+              f"{sentiment_index.index_at():+.2f}", help="Exponentially decayed average of article sentiment (+1 positive, -1 negative), fading to neutral without new articles.")
+    series = SENTIMENT_INDEX.series(stock_key)
+    if len(series) > 1:
+        st.line_chart(series["Sentiment"], height=160)
+
+def render_news_feed(processed_news):
+    # One element for the whole feed, rendered once per distinct processed-news list
+    st.markdown(news_feed_html(processed_news), unsafe_allow_html=True)
+
+@fragment()
+def render_news_search(stock_key, display_name):
+    # Searches every archived article routed to this stock; runs entirely on local data.
+    # Typing a query reruns only this fragment.
+    search_query = st.text_input(f"Search archived news for {display_name}", key=f"news_search_{stock_key}",
+                                 placeholder='e.g. profit growth or "order book"')
+    if not search_query:
+        return
+    start = time.perf_counter()
+    results = search_news(search_query, stock_key=stock_key)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    st.caption(f"{len(results)} result(s) in {elapsed_ms:.1f} ms")
+    if results:
+        st.markdown(search_results_html(results), unsafe_allow_html=True)
+
+def render_signal(latest_trading_signal):
+    st.markdown("---")
+    st.subheader("Trading Bot Signal (Simulated)")
+    st.write("This structured JSON output is generated directly by your Streamlit app.")
+    st.code(f"""
+{{
+    "ticker": "{latest_trading_signal['ticker']}",
+    "sentiment": "{latest_trading_signal['sentiment']}",
+    "sentiment_index": {latest_trading_signal['sentiment_index']},
+    "event": "{latest_trading_signal['event']}",
+    "confidence": {latest_trading_signal['confidence']},
+    "recommended_action": "{latest_trading_signal['recommended_action']}",
+    "stop_loss": {latest_trading_signal['stop_loss']},
+    "take_profit": {latest_trading_signal['take_profit']}
+}}
+""", language='json')
+
+# --- Page Sections (each one a fragment) ---
+@fragment(run_every=CACHE_SETTINGS["live_price"]["ttl"])
+def price_section(stock_key):
+    render_price_box(get_live_price_entry(stock_key, "BSE"), get_live_price_entry(stock_key, "NSE"))
+
+@fragment()
+def chart_section(stock_key, display_name):
+    # Timeframe, overlay, resolution and zoom changes rerun only this section
+    stock_data = get_historical_ohlc_yf(stock_key, selected_timeframe(stock_key), "NSE")
+    render_charts(stock_key, display_name, stock_data)
+
+@fragment(run_every=CACHE_SETTINGS["news"]["ttl"])
+def news_section(stock_key, display_name):
+    # The signal is derived from the same processed articles, so it renders with the feed
+    st.markdown("---")
+    st.subheader(f"Latest News for {display_name}")
+
+    news_entry = get_stock_news_entry(stock_key)
+    # Syndicated copies of one story collapse into a single card (and count once in the signal)
+    raw_articles = collapse_near_duplicates(news_entry.value)
+    st.caption(_age_caption("News", news_entry.age, news_entry.is_stale))
+    processed_news, latest_trading_signal = process_news(stock_key, raw_articles,
+                                                         get_base_ohlc_yf(stock_key, "1d", "NSE"))
+
+    if not raw_articles:
+        st.info(f"No news found for {display_name}.")
+    else:
+        render_news_feed(processed_news)
+
+    # --- Trading Bot Signal Output ---
+    render_signal(latest_trading_signal)
+    render_sentiment_index(stock_key, display_name)
+
+def render_stock_page(stock_key):
+    stock = get_stock(stock_key)
+    display_name = stock["display_name"]
+
+    if not get_news_api_key():
+        st.warning("NewsAPI.org API Key not found. News data will be mocked. "
+                   "Please add it to your Streamlit secrets or environment variables.")
+
+    # --- Streamlit UI Components ---
+    st.header(f"📈 Detailed Dashboard: {display_name}")
+    st.write(f"Comprehensive insights for {display_name} on BSE/NSE.")
+
+    prefetch_page_data(stock_key, selected_timeframe(stock_key))
+
+    price_section(stock_key)
+    chart_section(stock_key, display_name)
+    news_section(stock_key, display_name)
+    render_news_search(stock_key, display_name)
@@ -0,0 +1,351 @@
+# stockbot/streaming_indicators.py
+import json
+import math
+import os
+import threading
+from collections import deque
+
+import pandas as pd
+
+from stockbot.config import DATA_DIR
+from stockbot.indicators import DEFAULT_INDICATOR_PARAMS, compute_indicators
+from stockbot.ohlc_store import slice_period
+from stockbot.resample import BASE_PERIODS
+
+# --- Streaming Technical Indicators ---
+# O(1)-per-bar versions of the kernels in indicators.py. Each state object takes one new
+# value, returns the indicator for that bar and can be dumped to / restored from a plain
+# dict. They follow the same recursions as the adjust=False pandas code, so a stream fed
+# bar by bar gives the same values as compute_indicators over the whole history.
+NAN = float("nan")
+
+class StreamingEMA:
+    def __init__(self, alpha: float, min_periods: int = 0, value: float = None, count: int = 0):
+        self.alpha = alpha
+        self.min_periods = min_periods
+        self.value = value
+        self.count = count
+
+    @classmethod
+    def from_span(cls, span: int, min_periods: int = 0):
+        return cls(2 / (span + 1), min_periods)
+
+    def update(self, x: float):
+        self.value = x if self.value is None else self.value + self.alpha * (x - self.value)
+        self.count += 1
+        return self.current
+
+    @property
+    def current(self):
+        if self.value is None or self.count < self.min_periods:
+            return NAN
+        return self.value
+
+    def to_dict(self):
+        return {"alpha": self.alpha, "min_periods": self.min_periods, "value": self.value, "count": self.count}
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(state["alpha"], state["min_periods"], state["value"], state["count"])
+
+class StreamingRollingSum:
+    # Running sum and sum of squares over the last `window` values. The sums are rebuilt from
+    # the window once per `window` updates, so float drift never accumulates (amortized O(1)).
+    def __init__(self, window: int, values=(), since_resync: int = 0):
+        self.window = window
+        self.values = deque(values, maxlen=window)
+        self.since_resync = since_resync
+        self._resync()
+
+    def _resync(self):
+        self.total = math.fsum(self.values)
+        self.total_sq = math.fsum(v * v for v in self.values)
+
+    def update(self, x: float):
+        if len(self.values) == self.window:
+            oldest = self.values[0]
+            self.total -= oldest
+            self.total_sq -= oldest * oldest
+        self.values.append(x)
+        self.total += x
+        self.total_sq += x * x
+        self.since_resync += 1
+        if self.since_resync >= self.window:
+            self.since_resync = 0
+            self._resync()
+
+    @property
+    def full(self):
+        return len(self.values) == self.window
+
+    @property
+    def mean(self):
+        return self.total / self.window if self.full else NAN
+
+    @property
+    def std(self):
+        # Population std (ddof=0), as in indicators.bollinger
+        if not self.full:
+            return NAN
+        mean = self.total / self.window
+        return math.sqrt(max(self.total_sq / self.window - mean * mean, 0.0))
+
+    def to_dict(self):
+        return {"window": self.window, "values": list(self.values), "since_resync": self.since_resync}
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(state["window"], state["values"], state["since_resync"])
+
+class StreamingRSI:
+    def __init__(self, period: int = 14, prev_close: float = None, gain: dict = None, loss: dict = None):
+        self.period = period
+        self.prev_close = prev_close
+        self.gain = StreamingEMA.from_dict(gain) if gain else StreamingEMA(1 / period, period)
+        self.loss = StreamingEMA.from_dict(loss) if loss else StreamingEMA(1 / period, period)
+
+    def update(self, close: float):
+        if self.prev_close is None:
+            self.prev_close = close
+            return NAN # No change on the first bar
+        delta = close - self.prev_close
+        self.prev_close = close
+        avg_gain = self.gain.update(max(delta, 0.0))
+        avg_loss = self.loss.update(max(-delta, 0.0))
+        if math.isnan(avg_gain) or math.isnan(avg_loss):
+            return NAN
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else NAN # Same as pandas' inf / nan for rs
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+    def to_dict(self):
+        return {"period": self.period, "prev_close": self.prev_close,
+                "gain": self.gain.to_dict(), "loss": self.loss.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(state["period"], state["prev_close"], state["gain"], state["loss"])
+
+class StreamingATR:
+    def __init__(self, period: int = 14, prev_close: float = None, tr: dict = None):
+        self.period = period
+        self.prev_close = prev_close
+        self.tr = StreamingEMA.from_dict(tr) if tr else StreamingEMA(1 / period, period)
+
+    def update(self, high: float, low: float, close: float):
+        true_range = high - low
+        if self.prev_close is not None:
+            true_range = max(true_range, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+        return self.tr.update(true_range)
+
+    def to_dict(self):
+        return {"period": self.period, "prev_close": self.prev_close, "tr": self.tr.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(state["period"], state["prev_close"], state["tr"])
+
+class StreamingVWAP:
+    # Cumulative typical-price x volume over volume, reset at each new session when intraday
+    def __init__(self, session_reset: bool = True, session: str = None, pv: float = 0.0, volume: float = 0.0):
+        self.session_reset = session_reset
+        self.session = session
+        self.pv = pv
+        self.volume = volume
+
+    def update(self, ts: pd.Timestamp, high: float, low: float, close: float, volume: float):
+        session = ts.normalize().isoformat()
+        if self.session_reset and session != self.session:
+            self.pv, self.volume = 0.0, 0.0
+        self.session = session
+        self.pv += (high + low + close) / 3 * volume
+        self.volume += volume
+        return self.pv / self.volume if self.volume else NAN
+
+    def to_dict(self):
+        return {"session_reset": self.session_reset, "session": self.session, "pv": self.pv, "volume": self.volume}
+
+    @classmethod
+    def from_dict(cls, state):
+        return cls(state["session_reset"], state["session"], state["pv"], state["volume"])
+
+class IndicatorState:
+    # The full compute_indicators set as one bundle of streaming states
+    def __init__(self, params: dict = None, session_reset: bool = True):
+        p = {**DEFAULT_INDICATOR_PARAMS, **(params or {})}
+        self.params = p
+        self.sma = StreamingRollingSum(p["sma_window"])
+        self.bb = StreamingRollingSum(p["bb_window"])
+        self.ema = StreamingEMA.from_span(p["ema_span"])
+        self.macd_fast = StreamingEMA.from_span(p["macd_fast"])
+        self.macd_slow = StreamingEMA.from_span(p["macd_slow"])
+        self.macd_signal = StreamingEMA.from_span(p["macd_signal"])
+        self.rsi = StreamingRSI(p["rsi_period"])
+        self.atr = StreamingATR(p["atr_period"])
+        self.vwap = StreamingVWAP(session_reset)
+
+    def update(self, ts, high, low, close, volume):
+        p = self.params
+        self.sma.update(close)
+        self.bb.update(close)
+        macd_line = self.macd_fast.update(close) - self.macd_slow.update(close)
+        signal_line = self.macd_signal.update(macd_line)
+        bb_mid, bb_std = self.bb.mean, self.bb.std
+        return {
+            f"SMA_{p['sma_window']}": self.sma.mean,
+            f"EMA_{p['ema_span']}": self.ema.update(close),
+            f"RSI_{p['rsi_period']}": self.rsi.update(close),
+            "MACD": macd_line,
+            "MACD_signal": signal_line,
+            "MACD_hist": macd_line - signal_line,
+            "BB_mid": bb_mid,
+            "BB_upper": bb_mid + p["bb_num_std"] * bb_std,
+            "BB_lower": bb_mid - p["bb_num_std"] * bb_std,
+            f"ATR_{p['atr_period']}": self.atr.update(high, low, close),
+            "VWAP": self.vwap.update(ts, high, low, close, volume),
+        }
+
+    def to_dict(self):
+        return {"params": self.params, "sma": self.sma.to_dict(), "bb": self.bb.to_dict(),
+                "ema": self.ema.to_dict(), "macd_fast": self.macd_fast.to_dict(),
+                "macd_slow": self.macd_slow.to_dict(), "macd_signal": self.macd_signal.to_dict(),
+                "rsi": self.rsi.to_dict(), "atr": self.atr.to_dict(), "vwap": self.vwap.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state):
+        self = cls(state["params"], state["vwap"]["session_reset"])
+        self.sma = StreamingRollingSum.from_dict(state["sma"])
+        self.bb = StreamingRollingSum.from_dict(state["bb"])
+        for name in ("ema", "macd_fast", "macd_slow", "macd_signal"):
+            setattr(self, name, StreamingEMA.from_dict(state[name]))
+        self.rsi = StreamingRSI.from_dict(state["rsi"])
+        self.atr = StreamingATR.from_dict(state["atr"])
+        self.vwap = StreamingVWAP.from_dict(state["vwap"])
+        return self
+
+# --- Indicator Streams (one per symbol/base interval) ---
+# A stream remembers the last bar it consumed and only folds in bars after it. The store
+# keeps the most recent bar as a partial bar and overwrites it on the next fetch, so the
+# state from just before the last bar is kept too and that bar is replayed if it changed.
+# The indicator frame it returns is kept in memory and capped to `max_period`, so memory
+# and per-update work stay bounded however long the base series grows.
+class IndicatorStream:
+    def __init__(self, params: dict = None, session_reset: bool = True, max_period: str = "max"):
+        self.state = IndicatorState(params, session_reset)
+        self.max_period = max_period
+        self.previous = None # State dict from before the last bar
+        self.last_bar = None # (timestamp, high, low, close, volume) of the last bar consumed
+        self.frame = pd.DataFrame()
+
+    def _apply(self, rows):
+        out = []
+        for i, (ts, high, low, close, volume) in enumerate(rows):
+            if i == len(rows) - 1:
+                self.previous = self.state.to_dict()
+            out.append(self.state.update(ts, high, low, close, volume))
+            self.last_bar = (ts, high, low, close, volume)
+        return out
+
+    def extend(self, df: pd.DataFrame):
+        # Folds bars newer than the last one seen into the state; returns the indicator frame
+        if df.empty:
+            return self.frame
+        if self.last_bar is not None and df.index[-1] < self.last_bar[0]:
+            print("Indicator stream: Bars end before the last consumed bar. Replaying from scratch.")
+            self.__init__(self.state.params, self.state.vwap.session_reset, self.max_period)
+
+        if self.last_bar is not None and self.frame.empty:
+            # Restored from a checkpoint: only the state was saved, so the history up to the
+            # checkpoint is rebuilt once with the vectorized kernels
+            history = compute_indicators(df[df.index <= self.last_bar[0]], self.state.params)
+            self.frame = slice_period(history, self.max_period)
+
+        frame = self.frame
+        if self.last_bar is not None:
+            last_ts = self.last_bar[0]
+            pending = df[df.index >= last_ts]
+            if not pending.empty and pending.index[0] == last_ts:
+                revised = tuple(pending.iloc[0][["High", "Low", "Close", "Volume"]].astype(float))
+                if revised == tuple(self.last_bar[1:]):
+                    pending = pending.iloc[1:]
+                else:
+                    # The partial last bar was overwritten: rewind one bar and replay it
+                    self.state = IndicatorState.from_dict(self.previous)
+                    frame = frame.iloc[:-1]
+        else:
+            pending = df
+
+        if pending.empty:
+            return self.frame
+        rows = list(zip(pending.index, *(pending[column].astype(float).tolist()
+                                         for column in ("High", "Low", "Close", "Volume"))))
+        new = pd.DataFrame(self._apply(rows), index=pending.index)
+        self.frame = slice_period(new if frame.empty else pd.concat([frame, new]), self.max_period)
+        return self.frame
+
+    def to_dict(self):
+        ts, *values = self.last_bar if self.last_bar is not None else (None,)
+        return {"state": self.state.to_dict(), "previous": self.previous,
+                "last_bar": [ts.isoformat(), *values] if ts is not None else None}
+
+    @classmethod
+    def from_dict(cls, checkpoint, max_period: str = "max"):
+        self = cls(max_period=max_period)
+        self.state = IndicatorState.from_dict(checkpoint["state"])
+        self.previous = checkpoint["previous"]
+        if checkpoint["last_bar"] is not None:
+            ts, *values = checkpoint["last_bar"]
+            self.last_bar = (pd.Timestamp(ts), *values)
+        return self
+
+class IndicatorStreamStore:
+    # Keeps one stream per (symbol, base interval) in memory. Only the small state dict is
+    # checkpointed to disk, so a save costs the same however much history has streamed by,
+    # and a restart resumes from the last bar instead of replaying the whole base series.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._streams = {}
+
+    def _state_path(self, yf_symbol, interval):
+        return os.path.join(DATA_DIR, "indicators", interval, f"{yf_symbol}.json")
+
+    def _load(self, yf_symbol, interval, params):
+        key = (yf_symbol, interval)
+        stream = self._streams.get(key)
+        if stream is not None and stream.state.params == params:
+            return stream
+        max_period = BASE_PERIODS.get(interval, "max")
+        stream = IndicatorStream(params, max_period=max_period)
+        state_path = self._state_path(yf_symbol, interval)
+        if os.path.exists(state_path):
+            try:
+                with open(state_path) as f:
+                    checkpoint = json.load(f)
+                if checkpoint["state"]["params"] == params and checkpoint["last_bar"]:
+                    stream = IndicatorStream.from_dict(checkpoint, max_period)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Indicator stream: Could not restore {state_path}: {e}. Starting fresh.")
+        self._streams[key] = stream
+        return stream
+
+    def _save(self, yf_symbol, interval, stream):
+        state_path = self._state_path(yf_symbol, interval)
+        os.makedirs(os.path.dirname(state_path), exist_ok=True)
+        tmp_path = f"{state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(stream.to_dict(), f)
+        os.replace(tmp_path, state_path)
+
+    def extend(self, yf_symbol: str, interval: str, df: pd.DataFrame, params: dict = None):
+        params = {**DEFAULT_INDICATOR_PARAMS, **(params or {})}
+        with self._lock:
+            stream = self._load(yf_symbol, interval, params)
+            last_bar = stream.last_bar
+            frame = stream.extend(df)
+            if stream.last_bar != last_bar:
+                self._save(yf_symbol, interval, stream)
+            return frame
+
+# Shared by every page and session in the process
+INDICATOR_STREAMS = IndicatorStreamStore()
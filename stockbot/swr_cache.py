@@ -0,0 +1,96 @@
+# stockbot/swr_cache.py
+import threading
+import time
+from collections import namedtuple
+
+from stockbot.singleflight import UPSTREAM_FETCHES
+
+# --- Stale-While-Revalidate Cache ---
+# Values younger than `ttl` are fresh. Older values are still served immediately while one
+# background thread refreshes them, until they pass `max_staleness`; only then (or on a cold
+# miss) does a caller wait for the upstream call. A failed refresh keeps the last good value.
+# Any failed load, foreground or background, is remembered for `error_ttl`: until then callers
+# get the last good value (or, on a cold key, the same error at once) and no new refresh is
+# started, instead of calling upstream again on every read.
+CachedValue = namedtuple("CachedValue", ["value", "fetched_at", "age", "is_stale"])
+
+class StaleWhileRevalidateCache:
+    def __init__(self, name: str, ttl: float, max_staleness: float, error_ttl: float = 60, flight=UPSTREAM_FETCHES):
+        self.name = name
+        self.ttl = ttl
+        self.max_staleness = max_staleness
+        self.error_ttl = error_ttl
+        self._flight = flight
+        self._lock = threading.Lock()
+        self._entries = {} # key -> (value, fetched_at)
+        self._refreshing = set()
+        self._failures = {} # key -> (exception, failed_at) of the last failed load
+
+    def _load(self, key, loader, args):
+        # Coalesced with any other in-flight load of the same key (foreground or background)
+        value = self._flight.do((self.name,) + key, loader, *args)
+        fetched_at = time.time()
+        with self._lock:
+            self._entries[key] = (value, fetched_at)
+            self._failures.pop(key, None)
+        return value, fetched_at
+
+    def _refresh_in_background(self, key, loader, args):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self._load(key, loader, args)
+            except Exception as e:
+                print(f"SWR cache '{self.name}': Background refresh failed for {key}: {e}. Keeping last good value.")
+                with self._lock:
+                    self._failures[key] = (e, time.time())
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name=f"swr-{self.name}", daemon=True).start()
+
+    def get(self, key: tuple, loader, *args):
+        # `key` identifies the value; `loader(*args)` fetches it and raises on failure
+        with self._lock:
+            entry = self._entries.get(key)
+            failure = self._failures.get(key)
+        failed_recently = failure is not None and time.time() - failure[1] < self.error_ttl
+
+        if entry is not None:
+            value, fetched_at = entry
+            age = time.time() - fetched_at
+            if age < self.ttl:
+                return CachedValue(value, fetched_at, age, False)
+            if age < self.max_staleness:
+                if not failed_recently:
+                    self._refresh_in_background(key, loader, args)
+                return CachedValue(value, fetched_at, age, True)
+
+        if failed_recently:
+            # Upstream failed recently; answer now rather than wait on it again
+            if entry is None:
+                raise failure[0]
+            return CachedValue(entry[0], entry[1], time.time() - entry[1], True)
+
+        try:
+            value, fetched_at = self._load(key, loader, args)
+        except Exception as e:
+            with self._lock:
+                self._failures[key] = (e, time.time())
+            if entry is None:
+                raise
+            # Upstream is down: a very old value still beats no value
+            return CachedValue(entry[0], entry[1], time.time() - entry[1], True)
+        return CachedValue(value, fetched_at, 0.0, False)
+
+def format_age(seconds: float):
+    if seconds < 60:
+        return "just now"
+    if seconds < 60 * 60:
+        return f"{int(seconds // 60)} min ago"
+    return f"{int(seconds // 3600)} h ago"
@@ -0,0 +1,51 @@
+# stockbot/webgl_traces.py
+import numpy as np
+import plotly.graph_objects as go
+
+from stockbot.config import CHART_SETTINGS
+
+# --- WebGL Chart Encodings ---
+# SVG traces add one DOM node per point, which stalls the browser past a few thousand points.
+# Above CHART_SETTINGS["webgl_threshold"] points, lines become Scattergl. Plotly has no WebGL
+# candlestick, so each candle is drawn as two line segments in one Scattergl trace per
+# direction: a thin high-low wick and a thick open-close body.
+
+def use_webgl(num_points: int):
+    return num_points > CHART_SETTINGS["webgl_threshold"]
+
+def line_trace(num_points: int):
+    return go.Scattergl if use_webgl(num_points) else go.Scatter
+
+def _segments(x, y_start, y_end):
+    # x/y arrays of (start, end, gap) triples; the None gap breaks the line between segments
+    xs = np.empty(len(x) * 3, dtype=object)
+    ys = np.empty(len(x) * 3, dtype=object)
+    xs[0::3], xs[1::3], xs[2::3] = x, x, None
+    ys[0::3], ys[1::3], ys[2::3] = y_start, y_end, None
+    return xs, ys
+
+def webgl_candle_traces(candles, increasing_color='green', decreasing_color='red'):
+    up = (candles['Close'] >= candles['Open']).to_numpy()
+    x = np.asarray(candles.index.to_pydatetime(), dtype=object)
+    traces = []
+    for mask, color, name in ((up, increasing_color, "Up"), (~up, decreasing_color, "Down")):
+        bars = candles[mask]
+        wick_x, wick_y = _segments(x[mask], bars['Low'].to_numpy(), bars['High'].to_numpy())
+        body_x, body_y = _segments(x[mask], bars['Open'].to_numpy(), bars['Close'].to_numpy())
+        traces.append(go.Scattergl(x=wick_x, y=wick_y, mode='lines', line=dict(color=color, width=1),
+                                   name=name, legendgroup=name, showlegend=False, hoverinfo='skip'))
+        traces.append(go.Scattergl(x=body_x, y=body_y, mode='lines', line=dict(color=color, width=4),
+                                   name=name, legendgroup=name, showlegend=False))
+    return traces
+
+# Client-side range selector buttons; they zoom within the data already sent to the browser
+RANGE_SELECTOR = dict(buttons=[
+    dict(count=1, label="1h", step="hour", stepmode="backward"),
+    dict(count=1, label="1D", step="day", stepmode="backward"),
+    dict(count=5, label="5D", step="day", stepmode="backward"),
+    dict(count=1, label="1M", step="month", stepmode="backward"),
+    dict(count=6, label="6M", step="month", stepmode="backward"),
+    dict(count=1, label="YTD", step="year", stepmode="todate"),
+    dict(count=1, label="1Y", step="year", stepmode="backward"),
+    dict(step="all", label="All"),
+])
@@ -0,0 +1,77 @@
+# tests/test_dedup.py
+# Realistic syndicated near-copies must collapse; different stories about the same company must not.
+import random
+import time
+
+from stockbot.dedup import MAX_DISTANCE, collapse_near_duplicates, near_duplicate_clusters, simhash
+
+TITLE = "State Bank of India reports record quarterly profit as loan growth accelerates"
+DESCRIPTION = ("The lender said net profit rose 18% to Rs 18,000 crore in the September quarter, helped by "
+               "strong retail loan demand and lower provisions, the lender said on Saturday.")
+
+def article(title, content=DESCRIPTION, url=None):
+    return {"title": title, "content": content, "url": url or f"https://example.com/{abs(hash((title, content)))}"}
+
+def distance(a, b):
+    return bin(simhash(a) ^ simhash(b)).count("1")
+
+def test_source_suffix_collapses():
+    copies = [article(TITLE), article(f"{TITLE} - Moneycontrol")]
+    assert [a["cluster_size"] for a in collapse_near_duplicates(copies)] == [2]
+
+def test_reworded_copy_collapses():
+    copies = [article(TITLE), article(TITLE, DESCRIPTION.replace("the lender said on", "the bank said on"))]
+    assert [a["cluster_size"] for a in collapse_near_duplicates(copies)] == [2]
+
+def test_one_word_edits_stay_within_threshold():
+    rng = random.Random(7)
+    text = f"{TITLE} {DESCRIPTION}"
+    words = text.split()
+    replacements = ["bank", "shares", "rose", "fell", "quarter", "india", "lender", "company", "Reuters"]
+    within = 0
+    for _ in range(200):
+        edited = list(words)
+        edited[rng.randrange(len(edited))] = rng.choice(replacements)
+        within += distance(text, " ".join(edited)) <= MAX_DISTANCE
+    assert within >= 195
+
+def test_related_but_different_stories_stay_apart():
+    related = article("State Bank of India shares rise ahead of quarterly results",
+                      "Analysts expect the lender to report strong loan growth and stable asset quality in the "
+                      "September quarter, brokerages said on Monday.")
+    other = article("Tata Motors shares fall after JLR sales miss estimates",
+                    "Jaguar Land Rover wholesales declined 10% in the quarter as supply constraints hit "
+                    "production, the company said in a filing on Monday.")
+    collapsed = collapse_near_duplicates([article(TITLE), related, other])
+    assert [a["cluster_size"] for a in collapsed] == [1, 1, 1]
+
+def planted_fingerprints(rng, n_stories, n_copies, max_flips):
+    stories = [rng.getrandbits(64) for _ in range(n_stories)]
+    copies = []
+    for _ in range(n_copies):
+        fingerprint = rng.choice(stories)
+        for bit in rng.sample(range(64), rng.randint(0, max_flips)):
+            fingerprint ^= 1 << bit
+        copies.append(fingerprint)
+    return stories + copies
+
+def test_clusters_match_pairwise_comparison():
+    # Same clusters as comparing every fingerprint with every earlier representative
+    fingerprints = planted_fingerprints(random.Random(3), 300, 1200, 12)
+    representatives, expected = [], []
+    for j, fingerprint in enumerate(fingerprints):
+        cluster = next((i for i in representatives if bin(fingerprint ^ fingerprints[i]).count("1") <= MAX_DISTANCE), j)
+        if cluster == j:
+            representatives.append(j)
+        expected.append(cluster)
+    labels = near_duplicate_clusters(fingerprints).tolist()
+    first = {}
+    assert [first.setdefault(label, j) for j, label in enumerate(labels)] == expected
+
+def test_clustering_scales_to_large_batches():
+    # 32k articles used to take ~20 s with 7-bit band keys; every planted copy must still be found
+    fingerprints = planted_fingerprints(random.Random(11), 30_000, 2_000, MAX_DISTANCE)
+    start = time.perf_counter()
+    labels = near_duplicate_clusters(fingerprints)
+    assert time.perf_counter() - start < 5
+    assert len(set(labels.tolist())) == 30_000
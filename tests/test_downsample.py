@@ -0,0 +1,55 @@
+# tests/test_downsample.py
+# Decimated charts must keep what the eye looks for: every high and low, the first and
+# last points, and spikes in a line series.
+import numpy as np
+import pandas as pd
+
+from stockbot.downsample import aggregate_ohlc, bar_budget, lttb, lttb_indices
+from stockbot.mock_data import generate_mock_ohlcv
+
+def bars(num_points=100_000):
+    return generate_mock_ohlcv(num_points, 5 * 60, (600, 700), (100000, 5000000), rng=42, end="2024-06-28 15:25")
+
+def test_aggregated_candles_keep_every_high_and_low():
+    df = bars()
+    n_out = bar_budget("candles")
+    candles = aggregate_ohlc(df, n_out)
+    assert len(candles) == n_out
+    assert candles["High"].max() == df["High"].max()
+    assert candles["Low"].min() == df["Low"].min()
+    assert candles["Open"].iloc[0] == df["Open"].iloc[0]
+    assert candles["Close"].iloc[-1] == df["Close"].iloc[-1]
+    assert candles["Volume"].sum() == df["Volume"].sum()
+
+def test_each_bucket_spans_its_source_bars():
+    df = bars(1000)
+    candles = aggregate_ohlc(df, 7)
+    edges = list(candles.index) + [df.index[-1] + pd.Timedelta(minutes=5)]
+    for (start, end), (_, candle) in zip(zip(edges, edges[1:]), candles.iterrows()):
+        source = df[(df.index >= start) & (df.index < end)]
+        assert candle["High"] == source["High"].max()
+        assert candle["Low"] == source["Low"].min()
+        assert candle["Open"] == source["Open"].iloc[0]
+        assert candle["Close"] == source["Close"].iloc[-1]
+
+def test_short_series_are_left_alone():
+    df = bars(50)
+    close = df["Close"]
+    assert aggregate_ohlc(df, 100) is df
+    assert lttb(close, 100) is close
+
+def test_lttb_keeps_endpoints_and_spikes():
+    close = bars()["Close"].copy()
+    spike_at = 54_321
+    close.iloc[spike_at] = close.max() * 2
+    line = lttb(close, bar_budget("line"))
+    assert len(line) == bar_budget("line")
+    assert line.index[0] == close.index[0] and line.index[-1] == close.index[-1]
+    assert close.index[spike_at] in line.index
+    assert line.index.is_monotonic_increasing
+
+def test_lttb_indices_are_unique_and_sorted():
+    y = np.random.default_rng(1).standard_normal(10_000)
+    keep = lttb_indices(np.arange(len(y)), y, 500)
+    assert len(keep) == 500
+    assert (np.diff(keep) > 0).all()
@@ -0,0 +1,31 @@
+# tests/test_sentiment_index.py
+# The rolling index follows new articles and fades back to neutral when the news stops.
+from stockbot.sentiment_index import DecayedSentiment
+
+HOUR = 60 * 60
+
+def test_index_fades_to_neutral_without_new_articles():
+    index = DecayedSentiment(24 * HOUR)
+    for i in range(10):
+        index.update(i * HOUR, 1.0)
+    last = 9 * HOUR
+    assert index.label(last) == "positive"
+    assert index.index_at(last + 24 * HOUR) < index.index_at(last)
+    assert index.label(last + 14 * 24 * HOUR) == "neutral"
+
+def test_fresh_article_moves_a_faded_index_consistently():
+    index = DecayedSentiment(24 * HOUR)
+    for i in range(10):
+        index.update(i * HOUR, 1.0)
+    later = 9 * HOUR + 3 * 24 * HOUR
+    before = index.index_at(later)
+    index.update(later, 0.0)
+    # A neutral article pulls a positive index down, never up
+    assert 0 < index.index_at(later) < before
+
+def test_round_trip_keeps_the_reading():
+    index = DecayedSentiment(24 * HOUR)
+    index.update(0.0, -1.0)
+    index.update(HOUR, 1.0)
+    restored = DecayedSentiment.from_dict(index.to_dict())
+    assert restored.index_at(5 * HOUR) == index.index_at(5 * HOUR)
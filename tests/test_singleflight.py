@@ -0,0 +1,60 @@
+# tests/test_singleflight.py
+# Concurrent callers for one key share a single upstream call, its result and its error.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stockbot.singleflight import SingleFlight
+
+CALLERS = 100
+
+def run_concurrently(fn):
+    start = threading.Barrier(CALLERS)
+
+    def call():
+        start.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        futures = [pool.submit(call) for _ in range(CALLERS)]
+    return futures
+
+class SlowUpstream:
+    def __init__(self, error=None):
+        self.calls = 0
+        self.error = error
+        self._lock = threading.Lock()
+
+    def __call__(self, symbol):
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.2) # Long enough for every caller to arrive while the call is in flight
+        if self.error is not None:
+            raise self.error
+        return f"{symbol}:price"
+
+def test_concurrent_callers_share_one_upstream_call():
+    flight = SingleFlight()
+    upstream = SlowUpstream()
+    futures = run_concurrently(lambda: flight.do(("price", "SBIN.NS"), upstream, "SBIN.NS"))
+    assert [f.result() for f in futures] == ["SBIN.NS:price"] * CALLERS
+    assert upstream.calls == 1
+    assert flight.stats() == {"upstream_calls": 1, "shared_calls": CALLERS - 1, "in_flight": 0}
+
+def test_concurrent_callers_share_the_error():
+    flight = SingleFlight()
+    upstream = SlowUpstream(error=ConnectionError("upstream down"))
+    futures = run_concurrently(lambda: flight.do(("price", "SBIN.NS"), upstream, "SBIN.NS"))
+    for future in futures:
+        with pytest.raises(ConnectionError):
+            future.result()
+    assert upstream.calls == 1
+
+def test_different_keys_are_not_coalesced():
+    flight = SingleFlight()
+    upstream = SlowUpstream()
+    assert flight.do(("price", "A"), upstream, "A") == "A:price"
+    assert flight.do(("price", "B"), upstream, "B") == "B:price"
+    assert upstream.calls == 2
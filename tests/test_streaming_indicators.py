@@ -0,0 +1,58 @@
+# tests/test_streaming_indicators.py
+# Indicators streamed bar by bar, across a checkpoint and restore, must match the vectorized
+# kernels over the whole history.
+import json
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("yfinance") # streaming_indicators -> ohlc_store imports it
+
+from stockbot import streaming_indicators
+from stockbot.indicators import compute_indicators
+from stockbot.mock_data import generate_mock_ohlcv
+from stockbot.streaming_indicators import IndicatorStream, IndicatorStreamStore
+
+def bars(num_points=1500):
+    return generate_mock_ohlcv(num_points, 5 * 60, (600, 700), (100000, 5000000), rng=7, end="2024-06-28 15:25")
+
+def assert_matches_vectorized(frame, df):
+    expected = compute_indicators(df)
+    pd.testing.assert_frame_equal(frame, expected.loc[frame.index], check_exact=False, rtol=1e-7, check_freq=False)
+
+def test_stream_matches_vectorized_in_chunks():
+    df = bars()
+    stream = IndicatorStream()
+    for end in (50, 51, 400, 1000, len(df)):
+        frame = stream.extend(df.iloc[:end])
+    assert len(frame) == len(df)
+    assert_matches_vectorized(frame, df)
+
+def test_checkpoint_restore_resumes_without_drift():
+    df = bars()
+    stream = IndicatorStream()
+    stream.extend(df.iloc[:900])
+    checkpoint = json.loads(json.dumps(stream.to_dict()))
+
+    restored = IndicatorStream.from_dict(checkpoint)
+    frame = restored.extend(df)
+    assert len(frame) == len(df)
+    assert_matches_vectorized(frame, df)
+
+def test_revised_partial_bar_is_replayed():
+    df = bars()
+    stream = IndicatorStream()
+    stream.extend(df.iloc[:800])
+    revised = df.iloc[:800].copy()
+    revised.iloc[-1, revised.columns.get_loc("Close")] += 5.0
+    revised.iloc[-1, revised.columns.get_loc("High")] += 5.0
+    assert_matches_vectorized(stream.extend(revised), revised)
+
+def test_store_restores_checkpoint_after_restart(tmp_path, monkeypatch):
+    monkeypatch.setattr(streaming_indicators, "DATA_DIR", str(tmp_path))
+    df = bars()
+    IndicatorStreamStore().extend("TEST.NS", "5m", df.iloc[:1000])
+    # A new store stands in for a restarted process
+    frame = IndicatorStreamStore().extend("TEST.NS", "5m", df)
+    assert_matches_vectorized(frame, df)
+    assert (tmp_path / "indicators" / "5m" / "TEST.NS.json").exists()
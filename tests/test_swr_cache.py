@@ -0,0 +1,88 @@
+# tests/test_swr_cache.py
+# Stale values are served while refreshes run in the background, and a failing upstream is
+# not called again until error_ttl has passed.
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stockbot.singleflight import SingleFlight
+from stockbot.swr_cache import StaleWhileRevalidateCache
+
+class Upstream:
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.fail = False
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("upstream down")
+        return self.calls
+
+def wait_for_refresh(cache):
+    deadline = time.time() + 5
+    while cache._refreshing and time.time() < deadline:
+        time.sleep(0.001)
+
+def test_stale_value_is_served_while_refreshing():
+    cache = StaleWhileRevalidateCache("test", ttl=0.01, max_staleness=60, flight=SingleFlight())
+    upstream = Upstream()
+    assert cache.get(("k",), upstream).value == 1
+    time.sleep(0.02)
+    entry = cache.get(("k",), upstream)
+    assert (entry.value, entry.is_stale) == (1, True)
+    wait_for_refresh(cache)
+    assert cache.get(("k",), upstream).value == 2
+
+def test_failed_background_refresh_is_not_retried_within_error_ttl():
+    cache = StaleWhileRevalidateCache("test", ttl=0.01, max_staleness=60, error_ttl=60, flight=SingleFlight())
+    upstream = Upstream()
+    cache.get(("k",), upstream)
+    time.sleep(0.02)
+    upstream.fail = True
+    for _ in range(20):
+        entry = cache.get(("k",), upstream)
+        assert (entry.value, entry.is_stale) == (1, True)
+        wait_for_refresh(cache)
+    assert upstream.calls == 2 # The first load and one failed refresh
+
+def test_failed_cold_load_raises_without_calling_upstream_again():
+    cache = StaleWhileRevalidateCache("test", ttl=60, max_staleness=60, error_ttl=60, flight=SingleFlight())
+    upstream = Upstream()
+    upstream.fail = True
+    for _ in range(5):
+        with pytest.raises(ConnectionError):
+            cache.get(("k",), upstream)
+    assert upstream.calls == 1
+
+def test_concurrent_cold_misses_make_one_upstream_call():
+    cache = StaleWhileRevalidateCache("test", ttl=60, max_staleness=60, flight=SingleFlight())
+    upstream = Upstream(delay=0.2)
+    start = threading.Barrier(100)
+
+    def read():
+        start.wait()
+        return cache.get(("k",), upstream).value
+
+    with ThreadPoolExecutor(max_workers=100) as pool:
+        values = list(pool.map(lambda _: read(), range(100)))
+    assert values == [1] * 100
+    assert upstream.calls == 1
+
+def test_concurrent_stale_reads_start_one_refresh():
+    cache = StaleWhileRevalidateCache("test", ttl=0.01, max_staleness=60, flight=SingleFlight())
+    upstream = Upstream()
+    cache.get(("k",), upstream)
+    time.sleep(0.02)
+    upstream.delay = 0.2
+    with ThreadPoolExecutor(max_workers=100) as pool:
+        entries = list(pool.map(lambda _: cache.get(("k",), upstream), range(100)))
+    assert all(entry.value == 1 and entry.is_stale for entry in entries)
+    wait_for_refresh(cache)
+    assert upstream.calls == 2